@@ -0,0 +1,142 @@
+// backend/controllers/alertController.js
+const SavedSearch = require("../models/SavedSearch");
+const Notification = require("../models/Notification");
+const { skillIdsFor, roleIdFor } = require("../utils/taxonomy");
+
+const hasCriteria = ({ skills, role, location, batch }) =>
+  (Array.isArray(skills) && skills.length > 0) || role || location || batch;
+
+// Save a job search to be alerted on
+exports.createSavedSearch = async (req, res) => {
+  try {
+    const { name, skills, role, location, batch, experience } = req.body;
+
+    // A search with no skills, role, location or batch would match every job
+    if (!hasCriteria(req.body)) {
+      return res.status(400).json({
+        success: false,
+        message: "Add at least one of skills, role, location or batch"
+      });
+    }
+
+    // Alerts match on taxonomy ids (backend/scripts/alerts/percolator.py), so a
+    // skill or role the taxonomy doesn't know could never match a job
+    const unknownSkills = (Array.isArray(skills) ? skills : []).filter((skill) => skillIdsFor([skill]).length === 0);
+    if (unknownSkills.length > 0 || (role && !roleIdFor(role))) {
+      return res.status(400).json({
+        success: false,
+        message: "Some skills or the role are not recognised",
+        unknownSkills,
+        unknownRole: role && !roleIdFor(role) ? role : null
+      });
+    }
+
+    const savedSearch = await SavedSearch.create({
+      user: req.user._id,
+      name,
+      skills: Array.isArray(skills) ? skills : [],
+      role,
+      location,
+      batch,
+      experience: experience === undefined || experience === "" ? null : Number(experience)
+    });
+
+    res.status(201).json({
+      success: true,
+      savedSearch
+    });
+  } catch (error) {
+    console.error("Saved search error:", error);
+    res.status(500).json({
+      success: false,
+      message: "Error saving search",
+      error: error.message
+    });
+  }
+};
+
+// Get user's saved searches
+exports.getSavedSearches = async (req, res) => {
+  try {
+    const savedSearches = await SavedSearch.find({ user: req.user._id }).sort({ createdAt: -1 });
+
+    res.status(200).json({
+      success: true,
+      savedSearches
+    });
+  } catch (error) {
+    console.error("Get saved searches error:", error);
+    res.status(500).json({
+      success: false,
+      message: "Error fetching saved searches",
+      error: error.message
+    });
+  }
+};
+
+// Delete one of the user's saved searches
+exports.deleteSavedSearch = async (req, res) => {
+  try {
+    const deleted = await SavedSearch.findOneAndDelete({ _id: req.params.id, user: req.user._id });
+
+    if (!deleted) {
+      return res.status(404).json({
+        success: false,
+        message: "Saved search not found"
+      });
+    }
+
+    res.status(200).json({
+      success: true
+    });
+  } catch (error) {
+    console.error("Delete saved search error:", error);
+    res.status(500).json({
+      success: false,
+      message: "Error deleting saved search",
+      error: error.message
+    });
+  }
+};
+
+// Get user's job alerts, newest first; ?unread=true for unread only
+exports.getNotifications = async (req, res) => {
+  try {
+    const filter = { user: req.user._id };
+    if (req.query.unread === "true") filter.read = false;
+
+    const notifications = await Notification.find(filter)
+      .sort({ createdAt: -1 })
+      .limit(Math.min(parseInt(req.query.limit, 10) || 50, 200));
+
+    res.status(200).json({
+      success: true,
+      notifications
+    });
+  } catch (error) {
+    console.error("Get notifications error:", error);
+    res.status(500).json({
+      success: false,
+      message: "Error fetching notifications",
+      error: error.message
+    });
+  }
+};
+
+// Mark all of the user's alerts as read
+exports.markNotificationsRead = async (req, res) => {
+  try {
+    await Notification.updateMany({ user: req.user._id, read: false }, { read: true });
+
+    res.status(200).json({
+      success: true
+    });
+  } catch (error) {
+    console.error("Mark notifications read error:", error);
+    res.status(500).json({
+      success: false,
+      message: "Error updating notifications",
+      error: error.message
+    });
+  }
+};
@@ -1,33 +1,209 @@
 const mongoose = require("mongoose");
 
-const getTelegramJobs = async (req, res) => {
+const DEFAULT_PAGE_SIZE = 100;
+const MAX_PAGE_SIZE = 500;
+
+// Only the fields the dashboard list view reads. Telegram posts keep their
+// message in `text` (older scrapers) or `raw_text`, so expose whichever exists.
+const LIST_PROJECTION = {
+    title: 1,
+    company: 1,
+    company_id: 1,
+    company_name: 1,
+    role: 1,
+    position: 1,
+    location: 1,
+    experience: 1,
+    salary: 1,
+    batch: 1,
+    keySkills: 1,
+    skill_ids: 1,
+    role_ids: 1,
+    apply_link: 1,
+    description: 1,
+    source: 1,
+    createdAt: 1,
+    text: { $ifNull: ["$text", "$raw_text"] }
+};
+
+// Keyset cursor: the (createdAt, _id) of the last job on the previous page
+const encodeCursor = (job) =>
+    Buffer.from(`${new Date(job.createdAt).toISOString()}_${job._id}`).toString("base64url");
+
+const decodeCursor = (cursor) => {
+    const [createdAt, id] = Buffer.from(cursor, "base64url").toString().split("_");
+    const date = new Date(createdAt);
+    if (isNaN(date) || !mongoose.Types.ObjectId.isValid(id)) {
+        throw new Error("Invalid cursor");
+    }
+    return { createdAt: date, _id: new mongoose.Types.ObjectId(id) };
+};
+
+// Newest first; served by the { createdAt: -1, _id: -1 } index the Python
+// ingestion layer creates (backend/scripts/common/indexes.py), or by
+// { company_id: 1, createdAt: -1, _id: -1 } when filtered to one company
+const buildPipeline = (cursor, limit, companyId) => {
+    const pipeline = [];
+    if (companyId) {
+        pipeline.push({ $match: { company_id: String(companyId) } });
+    }
+    if (cursor) {
+        const { createdAt, _id } = decodeCursor(cursor);
+        pipeline.push({
+            $match: {
+                $or: [
+                    { createdAt: { $lt: createdAt } },
+                    { createdAt, _id: { $lt: _id } }
+                ]
+            }
+        });
+    }
+    pipeline.push({ $sort: { createdAt: -1, _id: -1 } });
+    if (limit) pipeline.push({ $limit: limit });
+    pipeline.push({ $project: LIST_PROJECTION });
+    return pipeline;
+};
+
+const wantsNdjson = (req) =>
+    req.query.format === "ndjson" || (req.get("Accept") || "").includes("application/x-ndjson");
+
+// GET /?limit=&cursor=&company=   -> { success, jobs, nextCursor }
+// GET /?format=ndjson&cursor=      -> one job per line until the collection is exhausted
+// company is a canonical company_id (see backend/scripts/common/company_resolver.py)
+const listJobs = (collectionName, label) => async (req, res) => {
+    const collection = mongoose.connection.db.collection(collectionName);
+    const { cursor, company } = req.query;
+
+    if (wantsNdjson(req)) {
+        let pipeline;
+        try {
+            pipeline = buildPipeline(cursor, undefined, company);
+        } catch (err) {
+            return res.status(400).json({ success: false, message: err.message });
+        }
+
+        res.status(200).set("Content-Type", "application/x-ndjson");
+        const jobs = collection.aggregate(pipeline, { batchSize: DEFAULT_PAGE_SIZE });
+        let closed = false;
+        res.once("close", () => { closed = true; });
+
+        // Resolves on "drain", or on "close" when the client goes away with the buffer full
+        const writable = () => new Promise((resolve) => {
+            const done = () => {
+                res.off("drain", done);
+                res.off("close", done);
+                resolve();
+            };
+            res.once("drain", done);
+            res.once("close", done);
+        });
+
+        try {
+            for await (const job of jobs) {
+                if (closed) break;
+                // Respect backpressure so a slow client can't make us buffer the collection
+                if (!res.write(JSON.stringify(job) + "\n")) {
+                    await writable();
+                }
+            }
+            if (!closed) res.end();
+        } catch (err) {
+            console.error(`Error streaming ${label} jobs:`, err);
+            res.destroy(err);
+        } finally {
+            await jobs.close().catch(() => {});
+        }
+        return;
+    }
+
     try {
-        const jobs = await mongoose.connection.db.collection("telegram").find({}).toArray();
+        const limit = Math.min(parseInt(req.query.limit, 10) || DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE);
+        let pipeline;
+        try {
+            pipeline = buildPipeline(cursor, limit + 1, company);
+        } catch (err) {
+            return res.status(400).json({ success: false, message: err.message });
+        }
+
+        // Fetch one extra row to know whether another page exists
+        const jobs = await collection.aggregate(pipeline).toArray();
+        const hasMore = jobs.length > limit;
+        if (hasMore) jobs.pop();
+
         res.status(200).json({
-            success: true, jobs
-        })
+            success: true,
+            jobs,
+            nextCursor: hasMore ? encodeCursor(jobs[jobs.length - 1]) : null
+        });
     } catch (err) {
         res.status(500).json({
-            success:false,
-            message: "Error fetching telegram jobs",
+            success: false,
+            message: `Error fetching ${label} jobs`,
             error: err.message
-        })
+        });
     }
 };
 
-const getTimesJobs = async (req, res) => {
+const getJobById = (collectionName, label) => async (req, res) => {
     try {
-        const jobs = await mongoose.connection.db.collection("timesjob").find({}).toArray();
-        res.status(200).json({
-            success: true, jobs
-        })
-    } catch(err) {
+        if (!mongoose.Types.ObjectId.isValid(req.params.id)) {
+            return res.status(400).json({ success: false, message: "Invalid job id" });
+        }
+        const job = await mongoose.connection.db
+            .collection(collectionName)
+            .findOne({ _id: new mongoose.Types.ObjectId(req.params.id) });
+
+        if (!job) {
+            return res.status(404).json({ success: false, message: "Job not found" });
+        }
+        res.status(200).json({ success: true, job });
+    } catch (err) {
         res.status(500).json({
-            success: false, 
-            message: "Error fetching times jobs",
+            success: false,
+            message: `Error fetching ${label} job`,
             error: err.message
-        })
+        });
     }
 };
 
-module.exports = { getTelegramJobs, getTimesJobs }
\ No newline at end of file
+// GET /companies?limit= -> { success, companies: [{ company_id, name, count }] }
+// Counts group on the company_id resolved at ingest time, so spelling variants
+// of one employer are already a single bucket
+const getCompanyFacets = (collectionName, label) => async (req, res) => {
+    try {
+        const limit = Math.min(parseInt(req.query.limit, 10) || DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE);
+        const companies = await mongoose.connection.db
+            .collection(collectionName)
+            .aggregate([
+                { $match: { company_id: { $type: "string" } } },
+                { $group: { _id: "$company_id", name: { $first: "$company_name" }, count: { $sum: 1 } } },
+                { $sort: { count: -1, _id: 1 } },
+                { $limit: limit },
+                { $project: { _id: 0, company_id: "$_id", name: 1, count: 1 } }
+            ])
+            .toArray();
+        res.status(200).json({ success: true, companies });
+    } catch (err) {
+        res.status(500).json({
+            success: false,
+            message: `Error fetching ${label} companies`,
+            error: err.message
+        });
+    }
+};
+
+const getTelegramJobs = listJobs("telegram", "telegram");
+const getTimesJobs = listJobs("timesjob", "times");
+const getTelegramJob = getJobById("telegram", "telegram");
+const getTimesJob = getJobById("timesjob", "times");
+const getTelegramCompanies = getCompanyFacets("telegram", "telegram");
+const getTimesCompanies = getCompanyFacets("timesjob", "times");
+
+module.exports = {
+    getTelegramJobs,
+    getTimesJobs,
+    getTelegramJob,
+    getTimesJob,
+    getTelegramCompanies,
+    getTimesCompanies
+}
@@ -1,52 +1,74 @@
 // backend/controllers/resumeParseController.js
-const ImageKit = require('imagekit');
 const cvHandler = require('../cvHandler');
+const { parseLocally, storeEnriched } = require('../services/resumeParserClient');
 
-// Make sure environment variables are accessible
-// Debug logs to check environment variables are loaded
-console.log("ImageKit Config Check:");
-console.log("- PUBLIC_KEY:", process.env.IMAGEKIT_PUBLIC_KEY ? "Loaded" : "Missing");
-console.log("- PRIVATE_KEY:", process.env.IMAGEKIT_PRIVATE_KEY ? "Loaded" : "Missing");
-console.log("- URL_ENDPOINT:", process.env.IMAGEKIT_URL_ENDPOINT ? "Loaded" : "Missing");
+const isValidUrl = (url) => typeof url === 'string' && url.startsWith('http');
 
-// Use string literals to ensure keys are properly defined
-const imagekit = new ImageKit({
-    publicKey: process.env.IMAGEKIT_PUBLIC_KEY || "public_wBuKV8oOQOOZu3tuua14Y85MUiM=",
-    privateKey: process.env.IMAGEKIT_PRIVATE_KEY || "private_5VmVpl+MyYTlAzDwPTy9P5AJRi4=", 
-    urlEndpoint: process.env.IMAGEKIT_URL_ENDPOINT || "https://ik.imagekit.io/ocxypkiqc"
+// Gemini is better at the narrative fields, the local parser at links and
+// contact details it read straight out of the PDF
+const mergeResumeData = (local, enriched) => ({
+    ...local,
+    ...enriched,
+    skills: [...new Set([...(enriched.skills || []), ...(local.skills || [])])],
+    contact: Object.fromEntries(
+        Object.keys({ ...local.contact, ...enriched.contact }).map((key) => {
+            const localValue = local.contact?.[key];
+            const useLocal = key === 'email' || key === 'phone' ? !!localValue : isValidUrl(localValue);
+            return [key, useLocal ? localValue : enriched.contact?.[key] || ""];
+        })
+    ),
+    extractedUrls: local.extractedUrls || enriched.extractedUrls || []
 });
 
+// Local parse first (cached by content hash); the LLM only runs on results that
+// haven't been enriched yet, and only when a Gemini key is configured
+const extractResumeData = async (pdfBuffer) => {
+    let local;
+    try {
+        local = await parseLocally(pdfBuffer);
+    } catch (error) {
+        console.error("Local resume parser unavailable, falling back to Gemini:", error.message);
+        return cvHandler(pdfBuffer);
+    }
+
+    if (local.enriched || !process.env.GEMINI_API_KEY) {
+        return local.data;
+    }
+
+    try {
+        const merged = mergeResumeData(local.data, await cvHandler(pdfBuffer));
+        await storeEnriched(local.hash, merged).catch((error) =>
+            console.error("Failed to cache enriched resume:", error.message)
+        );
+        return merged;
+    } catch (error) {
+        console.error("Gemini enrichment failed, using local parse:", error.message);
+        return local.data;
+    }
+};
+
 const parseResume = async (req, res) => {
     try {
         if (!req.file) {
-            return res.status(400).json({ 
-                success: false, 
-                message: 'No resume file uploaded' 
+            return res.status(400).json({
+                success: false,
+                message: 'No resume file uploaded'
             });
         }
 
-        // Upload the file to ImageKit
-        const uploadResult = await imagekit.upload({
-            file: req.file.buffer,
-            fileName: `resume_${Date.now()}`,
-            folder: process.env.IMAGEKIT_UPLOAD_FOLDER || "cv-parser"
-        });
-
-        // Process the CV using the cvHandler
-        const fileUrl = uploadResult.url;
-        const extractedData = await cvHandler(fileUrl);
+        const extractedData = await extractResumeData(req.file.buffer);
 
         // Transform data to match your user model structure
         const transformedData = {
-            name: extractedData.firstname && extractedData.lastname 
-                ? `${extractedData.firstname} ${extractedData.lastname}` 
+            name: extractedData.firstname && extractedData.lastname
+                ? `${extractedData.firstname} ${extractedData.lastname}`
                 : extractedData.firstname || extractedData.lastname || "",
             email: extractedData.contact?.email || "",
             skills: extractedData.skills || [],
             experience: extractedData.yearOfExperience?.toString() || "",
             role: extractedData.title || "Software Engineer",
-            education: extractedData.education?.length 
-                ? extractedData.education.map(edu => edu.institution).join(", ") 
+            education: extractedData.education?.length
+                ? extractedData.education.map(edu => edu.institution).join(", ")
                 : "",
             linkedin: extractedData.contact?.linkedin || "",
             github: extractedData.contact?.github || "",
@@ -70,4 +92,4 @@ const parseResume = async (req, res) => {
     }
 };
 
-module.exports = { parseResume };
\ No newline at end of file
+module.exports = { parseResume, extractResumeData };
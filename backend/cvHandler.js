@@ -1,22 +1,27 @@
 const { GoogleGenerativeAI } = require('@google/generative-ai');
 const axios = require('axios');
 
-async function cvHandler(fileUrl) {
-    console.log("📥 Starting CV processing for URL:", fileUrl);
+// Accepts either the PDF itself (Buffer) or a URL to download it from
+async function cvHandler(source) {
+    const isBuffer = Buffer.isBuffer(source);
+    console.log("📥 Starting CV processing for", isBuffer ? `uploaded PDF (${source.length} bytes)` : `URL: ${source}`);
 
     const GEMINI_API_KEY = process.env.GEMINI_API_KEY || require("./env").GEMINI_API_KEY;
     if (!GEMINI_API_KEY) throw new Error("❌ Gemini API key is not configured");
 
     try {
-        const downloadResponse = await axios({
-            method: 'GET',
-            url: fileUrl,
-            responseType: 'arraybuffer',
-            maxContentLength: 50 * 1024 * 1024,
-            timeout: 30000
-        });
+        let pdfFileData = source;
+        if (!isBuffer) {
+            const downloadResponse = await axios({
+                method: 'GET',
+                url: source,
+                responseType: 'arraybuffer',
+                maxContentLength: 50 * 1024 * 1024,
+                timeout: 30000
+            });
+            pdfFileData = downloadResponse.data;
+        }
 
-        const pdfFileData = downloadResponse.data;
         const genAI = new GoogleGenerativeAI(GEMINI_API_KEY);
         const model = genAI.getGenerativeModel({ model: "gemini-1.5-pro" });
 
@@ -7,12 +7,15 @@ const ImageKit = require('imagekit');
 const connectDB = require("./config/db");
 
 const applicationRoutes = require('./routes/applicationRoutes');
+const alertRoutes = require('./routes/alertRoutes');
 const jobRoutes = require('./routes/jobRoutes');
-const cvHandler = require('./cvHandler');
+const axios = require('axios');
+const { extractResumeData } = require('./controllers/resumeParseController');
 const resumeRoutes = require('./routes/resumeRoute');
 const authRoutes = require('./routes/authRoutes');
 const { exec } = require("child_process");
 const generateCoverLetterRoute = require("./routes/generateCoverLetter");
+const { scheduleCoverLetterPregeneration } = require("./services/coverLetterPregeneration");
 
 const app = express();
 app.use(cors({
@@ -75,15 +78,27 @@ app.post('/upload-cv', upload.single('file'), async (req, res) => {
     }
 });
 
-app.post('/process-cv', async(req, res) => {
-    const { fileUrl } = req.body;
+// Accepts the PDF itself (multipart "file") or, for older clients, a fileUrl to
+// download it from. Either way it goes through the local parser and its
+// content-hash cache, so re-uploading the same resume doesn't hit Gemini again
+app.post('/process-cv', upload.single('file'), async(req, res) => {
+    const fileUrl = req.body?.fileUrl;
 
-    if(!fileUrl) {
-        return res.status(400).json({ message: 'fileUrl is required' });
+    if(!req.file && !fileUrl) {
+        return res.status(400).json({ message: 'file or fileUrl is required' });
     }
 
     try {
-        const result = await cvHandler(fileUrl);
+        let pdfBuffer = req.file?.buffer;
+        if (!pdfBuffer) {
+            const download = await axios.get(fileUrl, {
+                responseType: 'arraybuffer',
+                maxContentLength: 50 * 1024 * 1024,
+                timeout: 30000
+            });
+            pdfBuffer = Buffer.from(download.data);
+        }
+        const result = await extractResumeData(pdfBuffer);
         res.json(result);
     } catch(err) {
         console.error("Error processing CV:", err);
@@ -101,6 +116,7 @@ app.use('/api/v1/jobs', jobRoutes);
 app.use("/api/v1/cover-letter", generateCoverLetterRoute);
 app.use('/api/v1/resume', resumeRoutes);
 app.use('/api/v1/applications', applicationRoutes);
+app.use('/api/v1/alerts', alertRoutes);
 
 const PORT = process.env.PORT || 5000;
 app.listen(PORT, ()=> console.log(`Server is runnig on PORT : ${PORT}`));
@@ -128,7 +144,7 @@ app.listen(PORT, ()=> console.log(`Server is runnig on PORT : ${PORT}`));
 //     testDBWrite();
 //   });
 
-connectDB();
+connectDB().then(scheduleCoverLetterPregeneration);
 
 //   const runScrapers = async () => {
 //         console.log("🔄 Running dummy...");
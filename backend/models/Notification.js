@@ -0,0 +1,31 @@
+// backend/models/Notification.js
+const mongoose = require("mongoose");
+
+// Written in micro-batches by the Python alert worker, one document per user
+// per batch of newly matched jobs
+const notificationSchema = new mongoose.Schema({
+  user: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: "User",
+    required: true,
+  },
+  jobs: [{
+    jobId: String,
+    source: String,
+    title: String,
+    company: String,
+    location: String,
+    apply_link: String,
+    searchId: mongoose.Schema.Types.ObjectId,
+  }],
+  read: {
+    type: Boolean,
+    default: false,
+  },
+}, {
+  timestamps: true
+});
+
+notificationSchema.index({ user: 1, createdAt: -1 });
+
+module.exports = mongoose.model("Notification", notificationSchema);
@@ -0,0 +1,48 @@
+// backend/models/SavedSearch.js
+const mongoose = require("mongoose");
+
+// A user's standing job search. New scraped jobs are matched against these by
+// the Python alert worker (scripts/alerts/alert_worker.py).
+const savedSearchSchema = new mongoose.Schema({
+  user: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: "User",
+    required: true,
+  },
+  name: {
+    type: String,
+    default: "",
+  },
+  // Any of these skills (aliases are resolved through the shared taxonomy)
+  skills: {
+    type: [String],
+    default: [],
+  },
+  role: {
+    type: String,
+    default: "",
+  },
+  location: {
+    type: String,
+    default: "",
+  },
+  batch: {
+    type: String,
+    default: "",
+  },
+  // Years of experience; jobs whose experience range excludes it are skipped
+  experience: {
+    type: Number,
+    default: null,
+  },
+  active: {
+    type: Boolean,
+    default: true,
+  },
+}, {
+  timestamps: true
+});
+
+savedSearchSchema.index({ user: 1 });
+
+module.exports = mongoose.model("SavedSearch", savedSearchSchema);
@@ -0,0 +1,20 @@
+// backend/routes/alertRoutes.js
+const express = require('express');
+const router = express.Router();
+const {
+  createSavedSearch,
+  getSavedSearches,
+  deleteSavedSearch,
+  getNotifications,
+  markNotificationsRead
+} = require('../controllers/alertController');
+const { protect } = require('../middlewares/authMiddleware');
+
+// All routes are protected
+router.post('/searches', protect, createSavedSearch);
+router.get('/searches', protect, getSavedSearches);
+router.delete('/searches/:id', protect, deleteSavedSearch);
+router.get('/notifications', protect, getNotifications);
+router.put('/notifications/read', protect, markNotificationsRead);
+
+module.exports = router;
@@ -1,9 +1,21 @@
 const express = require("express");
-const { getTelegramJobs, getTimesJobs} = require("../controllers/jobController");
+const {
+    getTelegramJobs,
+    getTimesJobs,
+    getTelegramJob,
+    getTimesJob,
+    getTelegramCompanies,
+    getTimesCompanies
+} = require("../controllers/jobController");
 
 const router = express.Router();
 
 router.get("/telegram", getTelegramJobs);
 router.get("/times", getTimesJobs);
+// Before the /:id routes so "companies" isn't taken for a job id
+router.get("/telegram/companies", getTelegramCompanies);
+router.get("/times/companies", getTimesCompanies);
+router.get("/telegram/:id", getTelegramJob);
+router.get("/times/:id", getTimesJob);
 
-module.exports = router;
\ No newline at end of file
+module.exports = router;
@@ -0,0 +1,154 @@
+import argparse
+import datetime
+import os
+import sys
+import time
+
+from pymongo import DESCENDING
+from pymongo.errors import OperationFailure
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(script_dir))
+
+from alerts.percolator import NotificationBatcher, Percolator
+from common.db import get_db
+from common.indexes import JOB_COLLECTIONS
+
+# Long-running worker: every job the scrapers insert is percolated against all
+# saved searches and matches are written to the notifications collection in
+# micro-batches. Uses a change stream when the server supports one (Atlas,
+# replica sets) and falls back to polling on (createdAt, _id) otherwise.
+
+SAVED_SEARCHES = "savedsearches"
+NOTIFICATIONS = "notifications"
+STATE = "alert_state"
+
+
+def load_saved_searches(db, percolator):
+    docs = list(db[SAVED_SEARCHES].find({"active": {"$ne": False}}))
+    percolator.load(docs)
+    print(f"🔎 Indexed {len(percolator.queries)} saved searches under {len(percolator.postings)} terms")
+    if percolator.unresolved:
+        print(f"⚠ Skipped {percolator.unresolved} saved searches with skills or roles missing from the taxonomy")
+
+
+class Worker:
+    def __init__(self, db, args):
+        self.db = db
+        self.args = args
+        self.percolator = Percolator()
+        self.batcher = NotificationBatcher(db[NOTIFICATIONS], args.batch_size, args.batch_delay)
+        self.next_reload = 0
+        self.matched = 0
+        self.jobs = 0
+
+    def tick(self):
+        """Periodic work between jobs: reload searches, flush a due batch"""
+        if time.monotonic() >= self.next_reload:
+            load_saved_searches(self.db, self.percolator)
+            self.next_reload = time.monotonic() + self.args.reload_interval
+        if self.batcher.due():
+            self.flush()
+
+    def flush(self):
+        sent = self.batcher.flush()
+        if sent:
+            print(f"🔔 Sent {sent} job alerts ({self.jobs} jobs percolated, {self.matched} matches so far)")
+        return sent
+
+    def handle(self, source, job_doc):
+        queries = self.percolator.percolate(job_doc)
+        self.jobs += 1
+        if queries:
+            self.matched += len(queries)
+            self.batcher.add(job_doc, source, queries)
+
+    def watch(self):
+        state = self.db[STATE].find_one({"_id": "change_stream"}) or {}
+        pipeline = [{"$match": {"operationType": "insert", "ns.coll": {"$in": JOB_COLLECTIONS}}}]
+        saved_token, saved_at = state.get("token"), 0
+        with self.db.watch(pipeline, resume_after=saved_token, max_await_time_ms=500) as stream:
+            print("✅ Watching job collections for new inserts")
+            while True:
+                self.tick()
+                change = stream.try_next()
+                if change is not None:
+                    self.handle(change["ns"]["coll"], change["fullDocument"])
+
+                # Only persist the resume token when nothing is waiting in the
+                # batcher, so a restart re-percolates unsent matches instead of
+                # losing them
+                token = stream.resume_token
+                if self.batcher.size == 0 and token != saved_token and time.monotonic() - saved_at >= 1:
+                    self.db[STATE].replace_one(
+                        {"_id": "change_stream"}, {"_id": "change_stream", "token": token}, upsert=True
+                    )
+                    saved_token, saved_at = token, time.monotonic()
+
+    def poll(self):
+        # Marks are persisted like the change stream token, so jobs scraped while
+        # the worker was down are still percolated after a restart
+        state = self.db[STATE].find_one({"_id": "poll"})
+        if state:
+            marks = {name: tuple(state["marks"][name]) if state["marks"].get(name) else None for name in JOB_COLLECTIONS}
+        else:
+            # First run: start at the newest jobs rather than alerting on the whole corpus
+            marks = {}
+            for name in JOB_COLLECTIONS:
+                latest = self.db[name].find_one({}, {"createdAt": 1}, sort=[("createdAt", DESCENDING), ("_id", DESCENDING)])
+                marks[name] = (latest["createdAt"], latest["_id"]) if latest else None
+        saved_marks = None
+        print(f"✅ Polling job collections every {self.args.poll_interval}s")
+
+        lag = datetime.timedelta(seconds=self.args.poll_lag)
+        while True:
+            self.tick()
+            # createdAt is stamped just before a bulk write lands (job_upserts), so
+            # trail now by a lag: a mark can then never pass a write in progress
+            cutoff = datetime.datetime.now(datetime.timezone.utc) - lag
+            for name in JOB_COLLECTIONS:
+                query = {"createdAt": {"$lte": cutoff}}
+                if marks[name]:
+                    created, last_id = marks[name]
+                    query["$or"] = [{"createdAt": {"$gt": created}}, {"createdAt": created, "_id": {"$gt": last_id}}]
+                for doc in self.db[name].find(query).sort([("createdAt", 1), ("_id", 1)]):
+                    self.handle(name, doc)
+                    marks[name] = (doc["createdAt"], doc["_id"])
+
+            # Same rule as the resume token: only move the saved marks once the
+            # batcher is empty, so unsent matches are re-percolated after a crash
+            if self.batcher.size == 0 and marks != saved_marks:
+                self.db[STATE].replace_one(
+                    {"_id": "poll"},
+                    {"_id": "poll", "marks": {name: list(mark) if mark else None for name, mark in marks.items()}},
+                    upsert=True
+                )
+                saved_marks = dict(marks)
+            time.sleep(self.args.poll_interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Match newly scraped jobs against saved searches")
+    parser.add_argument("--batch-size", type=int, default=200, help="Flush after this many matches")
+    parser.add_argument("--batch-delay", type=float, default=2.0, help="Flush matches older than this (seconds)")
+    parser.add_argument("--reload-interval", type=int, default=30, help="Seconds between saved search reloads")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Used when change streams are unavailable")
+    parser.add_argument("--poll-lag", type=float, default=60.0,
+                        help="Only poll jobs written at least this many seconds ago, so late commits aren't skipped")
+    args = parser.parse_args()
+
+    db = get_db()
+    db[NOTIFICATIONS].create_index([("user", 1), ("createdAt", DESCENDING)])
+    worker = Worker(db, args)
+
+    try:
+        try:
+            worker.watch()
+        except OperationFailure as e:
+            print(f"⚠ Change streams unavailable ({str(e)}), falling back to polling")
+            worker.poll()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.flush()
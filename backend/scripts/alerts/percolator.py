@@ -0,0 +1,206 @@
+import datetime
+import re
+import time
+from collections import Counter, defaultdict
+
+from common.taxonomy import get_taxonomy
+
+# Reverse index ("percolator") over users' saved searches. Instead of running
+# every user's query against the job corpus, each incoming job is run against
+# the queries: every query is indexed under one anchor term it requires, a job
+# looks up the postings for the terms it contains, and only those candidates
+# are fully checked. The per-job cost depends on how many queries could match,
+# not on how many users exist.
+
+YEAR_RE = re.compile(r"\b20\d\d\b")
+RANGE_RE = re.compile(r"(\d+)\s*(?:-|to)\s*(\d+)\s*(?:yrs?|years?)", re.IGNORECASE)
+MIN_RE = re.compile(r"(\d+)\s*\+?\s*(?:yrs?|years?)", re.IGNORECASE)
+WORD_RE = re.compile(r"[a-z]+")
+
+
+def location_tokens(value):
+    return set(WORD_RE.findall((value or "").lower()))
+
+
+def experience_range(value):
+    """(min, max) years from strings like "0-2 Yrs", "3 to 5 years", "2+ years"""
+    if not value:
+        return None
+    if "fresher" in value.lower():
+        return 0, 0
+    match = RANGE_RE.search(value)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    match = MIN_RE.search(value)
+    if match:
+        return int(match.group(1)), 99
+    return None
+
+
+class SavedQuery:
+    """A user's standing search, with its fields resolved to taxonomy ids and tokens"""
+
+    def __init__(self, doc):
+        taxonomy = get_taxonomy()
+        self.id = doc["_id"]
+        self.user = doc["user"]
+        # Skills are "any of": a job matching one of them is interesting
+        skills = doc.get("skills") or []
+        self.skill_ids = {sid for sid in (taxonomy.skill_id(s) for s in skills) if sid}
+        self.role_id = taxonomy.role_id(doc["role"]) if doc.get("role") else None
+        # A skill or role the taxonomy doesn't know can never match a job's ids.
+        # Dropping it would broaden the query ("Elixir" in Pune -> any Pune job),
+        # so the query as a whole can't match instead.
+        self.unresolved = bool(skills and not self.skill_ids) or bool(doc.get("role") and not self.role_id)
+        self.location = location_tokens(doc.get("location"))
+        self.batch = set(YEAR_RE.findall(str(doc.get("batch") or "")))
+        self.experience = doc.get("experience")
+
+    def clauses(self):
+        """Required clauses as (name, terms); a job must contain one of the terms of each"""
+        clauses = []
+        if self.skill_ids:
+            clauses.append(("skill", [("skill", sid) for sid in self.skill_ids]))
+        if self.role_id:
+            clauses.append(("role", [("role", self.role_id)]))
+        if self.location:
+            # Every location word must appear; any one of them is a valid anchor
+            clauses.append(("location", [("loc", token) for token in self.location]))
+        if self.batch:
+            clauses.append(("batch", [("batch", year) for year in self.batch]))
+        return clauses
+
+    def matches(self, job):
+        if self.unresolved:
+            return False
+        if self.skill_ids and not self.skill_ids & job.skill_ids:
+            return False
+        if self.role_id and self.role_id not in job.role_ids:
+            return False
+        if self.location and not self.location <= job.location:
+            return False
+        if self.batch and not self.batch & job.batch:
+            return False
+        if self.experience is not None and job.experience:
+            low, high = job.experience
+            if not low <= self.experience <= high:
+                return False
+        return True
+
+
+class IncomingJob:
+    """The fields of a scraped job the percolator matches on"""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.skill_ids = set(doc.get("skill_ids") or [])
+        self.role_ids = set(doc.get("role_ids") or [])
+        self.location = location_tokens(doc.get("location"))
+        self.batch = set(YEAR_RE.findall(doc.get("batch") or ""))
+        self.experience = experience_range(doc.get("experience"))
+
+    def terms(self):
+        terms = [("skill", sid) for sid in self.skill_ids]
+        terms += [("role", rid) for rid in self.role_ids]
+        terms += [("loc", token) for token in self.location]
+        terms += [("batch", year) for year in self.batch]
+        return terms
+
+
+class Percolator:
+    def __init__(self):
+        self.postings = defaultdict(list)
+        self.queries = {}
+        # How often each term shows up in jobs, used to pick rare anchors
+        self.term_counts = Counter()
+        self.jobs_seen = 0
+        self.unresolved = 0
+
+    def _clause_cost(self, terms):
+        # A disjunctive clause has to be posted under each of its terms, and
+        # each posting is hit as often as that term appears in jobs
+        return sum(self.term_counts[term] + 1 for term in terms)
+
+    def load(self, saved_search_docs):
+        """(Re)build the index; anchors are chosen using the term frequencies seen so far"""
+        postings = defaultdict(list)
+        queries = {}
+        unresolved = 0
+        for doc in saved_search_docs:
+            query = SavedQuery(doc)
+            if query.unresolved:
+                unresolved += 1
+                continue
+            clauses = query.clauses()
+            if not clauses:
+                # A query with no indexable clause would match every job
+                continue
+            queries[query.id] = query
+            _, anchor_terms = min(clauses, key=lambda clause: self._clause_cost(clause[1]))
+            if anchor_terms[0][0] == "loc":
+                # All location words are required, so posting under the rarest one is enough
+                anchor_terms = [min(anchor_terms, key=lambda term: self.term_counts[term])]
+            for term in anchor_terms:
+                postings[term].append(query)
+        self.postings, self.queries, self.unresolved = postings, queries, unresolved
+
+    def percolate(self, job_doc):
+        """Saved queries matching a new job"""
+        job = IncomingJob(job_doc)
+        terms = job.terms()
+        self.term_counts.update(terms)
+        self.jobs_seen += 1
+
+        candidates = {}
+        for term in terms:
+            for query in self.postings.get(term, ()):
+                candidates[query.id] = query
+        return [query for query in candidates.values() if query.matches(job)]
+
+
+class NotificationBatcher:
+    """Collects matches and writes one notification per user per flush"""
+
+    def __init__(self, collection, max_batch=200, max_delay=2.0):
+        self.collection = collection
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending = defaultdict(list)
+        self.size = 0
+        self.oldest = None
+
+    def add(self, job_doc, source, queries):
+        for query in queries:
+            self.pending[query.user].append({
+                "jobId": str(job_doc["_id"]),
+                "source": source,
+                "title": job_doc.get("title") or "",
+                "company": job_doc.get("company") or "",
+                "location": job_doc.get("location") or "",
+                "apply_link": job_doc.get("apply_link") or "",
+                "searchId": query.id,
+            })
+            self.size += 1
+        if self.size and self.oldest is None:
+            self.oldest = time.monotonic()
+        if self.size >= self.max_batch:
+            self.flush()
+
+    def due(self):
+        return self.oldest is not None and time.monotonic() - self.oldest >= self.max_delay
+
+    def flush(self):
+        if not self.pending:
+            return 0
+        now = datetime.datetime.now(datetime.timezone.utc)
+        docs = []
+        for user, jobs in self.pending.items():
+            # The same job can match several of a user's searches
+            unique = list({job["jobId"]: job for job in jobs}.values())
+            docs.append({"user": user, "jobs": unique, "read": False, "createdAt": now, "updatedAt": now})
+        self.collection.insert_many(docs)
+        sent = self.size
+        self.pending = defaultdict(list)
+        self.size = 0
+        self.oldest = None
+        return sent
@@ -0,0 +1,225 @@
+import datetime
+import os
+import re
+import sys
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+# Company name entity resolution. Scrapers see the same employer as
+# "Infosys", "infosys ltd" and "Infosys Limited"; each raw name is normalized
+# and resolved against a growing registry of canonical companies (the
+# `companies` collection), and the canonical id is stored on the job at ingest
+# time. Grouping, dedup and per-company facets are then plain lookups on
+# company_id instead of fuzzy matching at query time.
+#
+# Resolution order for a raw name: memo of raw strings already seen, exact
+# match on the normalized key, trigram similarity against the registry, and
+# otherwise a new canonical entry.
+
+COMPANIES = "companies"
+
+# Trailing tokens that only describe the legal form ("Pvt. Ltd.", "Inc")
+LEGAL_SUFFIXES = {
+    "ltd", "limited", "pvt", "private", "inc", "incorporated", "llc", "llp", "plc",
+    "corp", "corporation", "co", "company", "gmbh", "ag", "pte", "bv", "nv",
+}
+LEADING_NOISE = {"the", "m/s", "ms"}
+NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+# Short keys ("tcs", "ibm") are too ambiguous for fuzzy matching
+MIN_FUZZY_LENGTH = 5
+
+
+def normalize_company(name):
+    """Normalized words of a company name: lowercase, no accents, punctuation or legal suffixes"""
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = text.replace("&", " and ")
+    words = text.split()
+    while words and words[0] in LEADING_NOISE:
+        words = words[1:]
+    words = NON_WORD_RE.sub(" ", " ".join(words)).split()
+    # Keep at least one word: "The Company" should not normalize to nothing
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+        # "Goldman Sachs & Co." would otherwise end in a dangling "and"
+        if len(words) > 1 and words[-1] == "and":
+            words.pop()
+    return " ".join(words)
+
+
+def display_name(name):
+    """Raw name minus trailing legal suffixes, keeping its original casing"""
+    words = name.strip().split()
+    if len(words) > 1 and words[0].lower() in ("m/s", "m/s.", "ms"):
+        words = words[1:]
+    while (len(words) > 1 and words[-2].lower() not in LEADING_NOISE
+           and NON_WORD_RE.sub("", words[-1].lower()) in LEGAL_SUFFIXES):
+        words.pop()
+        if len(words) > 1 and words[-1].lower() in ("&", "and"):
+            words.pop()
+    return " ".join(words).strip(" ,.-")
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Candidates by shared trigrams, ranked by Dice similarity"""
+
+    def __init__(self):
+        self._postings = defaultdict(set)
+        self._grams = {}
+
+    def add(self, key, company_id):
+        grams = trigrams(key)
+        self._grams[company_id] = grams
+        for gram in grams:
+            self._postings[gram].add(company_id)
+
+    def best(self, key, threshold):
+        """(company_id, score) of the most similar entry at or above threshold, or None"""
+        grams = trigrams(key)
+        shared = Counter()
+        for gram in grams:
+            for company_id in self._postings.get(gram, ()):
+                shared[company_id] += 1
+
+        best = None
+        for company_id, count in shared.items():
+            score = 2 * count / (len(grams) + len(self._grams[company_id]))
+            if score >= threshold and (best is None or score > best[1]):
+                best = (company_id, score)
+        return best
+
+
+class CompanyResolver:
+    def __init__(self, collection=None, threshold=0.8, memo_size=50000):
+        # collection: the `companies` collection, or None for an in-memory registry
+        self.collection = collection
+        self.threshold = threshold
+        self.memo_size = memo_size
+        self.names = {}
+        self._by_key = {}
+        self._index = TrigramIndex()
+        self._memo = {}
+        self.stats = Counter()
+        if collection is not None:
+            for doc in collection.find({}, {"name": 1, "aliases": 1}):
+                self._register(doc["_id"], doc["name"], doc.get("aliases") or [])
+
+    def _register(self, company_id, name, aliases):
+        self.names[company_id] = name
+        for alias in [company_id.replace("-", " ")] + aliases:
+            compact = alias.replace(" ", "")
+            # "HCL Tech" and "HCLTech" share a compact key
+            self._by_key.setdefault(compact, company_id)
+            if len(compact) >= MIN_FUZZY_LENGTH:
+                self._index.add(compact, company_id)
+
+    def _remember(self, raw, company_id):
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[raw] = company_id
+        return company_id, self.names.get(company_id, "")
+
+    def resolve(self, raw):
+        """(company_id, canonical name) for a raw company name; (None, "") when there is none"""
+        if raw in self._memo:
+            self.stats["memo"] += 1
+            company_id = self._memo[raw]
+            return company_id, self.names.get(company_id, "")
+
+        key = normalize_company(raw)
+        if not key:
+            return self._remember(raw, None)
+        compact = key.replace(" ", "")
+
+        company_id = self._by_key.get(compact)
+        if company_id:
+            self.stats["exact"] += 1
+            self._maybe_upgrade_name(company_id, raw)
+            return self._remember(raw, company_id)
+
+        match = self._index.best(compact, self.threshold) if len(compact) >= MIN_FUZZY_LENGTH else None
+        if match:
+            self.stats["fuzzy"] += 1
+            company_id = match[0]
+            # Remember the spelling so the next process resolves it exactly
+            self._register(company_id, self.names[company_id], [key])
+            if self.collection is not None:
+                self.collection.update_one({"_id": company_id}, {"$addToSet": {"aliases": key}})
+            return self._remember(raw, company_id)
+
+        self.stats["new"] += 1
+        company_id = key.replace(" ", "-")
+        name = display_name(raw)
+        if self.collection is not None:
+            # Another scraper may have created it meanwhile; keep whichever name was stored first
+            self.collection.update_one(
+                {"_id": company_id},
+                {"$setOnInsert": {"name": name, "aliases": [], "createdAt": datetime.datetime.now(datetime.timezone.utc)}},
+                upsert=True
+            )
+        self._register(company_id, name, [])
+        return self._remember(raw, company_id)
+
+    def _maybe_upgrade_name(self, company_id, raw):
+        # techuprise.py lowercases names; prefer a properly cased spelling once one shows up
+        name = self.names[company_id]
+        if name.islower() and not raw.islower():
+            better = display_name(raw)
+            self.names[company_id] = better
+            if self.collection is not None:
+                self.collection.update_one({"_id": company_id, "name": name}, {"$set": {"name": better}})
+
+
+# The backfill resolves from asyncio.to_thread workers; one resolver, one caller at a time
+_resolver_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_resolver():
+    from common.db import get_db
+
+    return CompanyResolver(get_db()[COMPANIES])
+
+
+def company_fields(raw_name):
+    """company_id / company_name to store on a job document at ingest time
+
+    May query the companies collection, so async callers run it off the event loop.
+    """
+    with _resolver_lock:
+        company_id, name = get_resolver().resolve(raw_name)
+    return {"company_id": company_id, "company_name": name}
+
+
+if __name__ == "__main__":
+    # Tag jobs stored before company resolution existed
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from pymongo import UpdateOne
+
+    from common.db import get_db
+    from common.indexes import JOB_COLLECTIONS, ensure_job_indexes
+
+    db = get_db()
+    resolver = get_resolver()
+    for name in JOB_COLLECTIONS:
+        ensure_job_indexes(db[name])
+        ops = []
+        for doc in db[name].find({"company_id": {"$exists": False}}, {"company": 1}):
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": company_fields(doc.get("company"))}))
+            if len(ops) >= 1000:
+                db[name].bulk_write(ops, ordered=False)
+                ops = []
+        if ops:
+            db[name].bulk_write(ops, ordered=False)
+        print(f"✅ Resolved companies on {name}")
+    print(f"📊 {len(resolver.names)} canonical companies, lookups: {dict(resolver.stats)}")
@@ -0,0 +1,22 @@
+import os
+
+from pymongo import MongoClient
+
+# Connection settings come from the environment so the same scripts can run
+# against Atlas, a local mongod or a test stand-in without code changes
+MONGO_URI = os.environ.get("MONGO_URI", "mongodb://localhost:27017/")
+MONGO_DB = os.environ.get("MONGO_DB", "test")
+
+_client = None
+
+
+def get_client():
+    """Return a process-wide MongoClient (pymongo clients are thread-safe)"""
+    global _client
+    if _client is None:
+        _client = MongoClient(MONGO_URI)
+    return _client
+
+
+def get_db():
+    return get_client()[MONGO_DB]
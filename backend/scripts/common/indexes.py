@@ -0,0 +1,36 @@
+import os
+import sys
+
+from pymongo import ASCENDING, DESCENDING
+
+JOB_COLLECTIONS = ["telegram", "timesjob"]
+
+
+def ensure_job_indexes(collection):
+    """Indexes the jobs API relies on; create_index is a no-op when they exist"""
+    # Keyset pagination in jobController.js sorts and seeks on (createdAt, _id)
+    collection.create_index([("createdAt", DESCENDING), ("_id", DESCENDING)], name="createdAt_id_desc")
+    # Per-company listing (?company=) and the company facet counts
+    collection.create_index(
+        [("company_id", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+        name="company_createdAt_id"
+    )
+    if collection.name == "telegram":
+        # Message ids are only unique within a chat, so (group, message_id) is
+        # the natural key that makes re-ingesting a message a no-op
+        collection.create_index(
+            [("group", ASCENDING), ("message_id", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"message_id": {"$exists": True}},
+            name="group_message_id_unique"
+        )
+
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.db import get_db
+
+    db = get_db()
+    for name in JOB_COLLECTIONS:
+        ensure_job_indexes(db[name])
+        print(f"✅ Indexes ready on {name}")
@@ -0,0 +1,235 @@
+import datetime
+import re
+
+from pymongo import UpdateOne
+
+from common.company_resolver import company_fields
+from common.taxonomy import taxonomy_fields
+
+# Shared field extractor for Telegram job posts. This is the labelled-field
+# parser from krishan_kumar.py, pulled out so batch tools such as the backfill
+# can reuse it without running a scraper on import.
+
+
+def parse_job_details(text):
+    """Parse job details from message text with improved pattern matching for various formats"""
+    # Initialize job details with default values
+    job_details = {
+        "title": None,
+        "company": None,
+        "position": None,
+        "role": None,
+        "qualifications": None,
+        "salary": None,
+        "batch": None,
+        "experience": None,
+        "location": None,
+        "apply_link": None,
+        "whatsapp_link": None,
+        "telegram_link": None,
+        "posted_by": None
+    }
+    
+    if not text:
+        return job_details
+    
+    # Split text into lines for easier processing
+    lines = text.strip().split('\n')
+    
+    # Check for different header formats - using case insensitive pattern matching
+    header_patterns = [
+        r'Jobs\s*\|\s*Internships\s*\|\s*Placement\s*\|\s*Interviews',
+        r'.*\s*-\s*Jobs\s*&\s*Internships\s*Updates'
+    ]
+    
+    # Check for headers and extract poster name
+    for pattern in header_patterns:
+        header_match = re.search(pattern, text, re.IGNORECASE)
+        if header_match:
+            header_line = header_match.group(0).strip()
+            # Check if there's a name in the header (like "Krishan Kumar - Jobs & Internships Updates")
+            name_match = re.search(r'^(.*?)\s*-\s*Jobs', header_line, re.IGNORECASE)
+            if name_match:
+                job_details["posted_by"] = name_match.group(1).strip()
+            break
+    
+    # Process each line to extract labeled fields
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # Skip empty lines
+        if not line:
+            continue
+        
+        # Extract labeled fields with colon format - case insensitive
+        if ":" in line:
+            parts = line.split(":", 1)
+            if len(parts) == 2:
+                label = parts[0].strip().lower()  # Convert to lowercase for case-insensitive matching
+                value = parts[1].strip()
+                
+                # Case-insensitive matching for all field labels
+                if any(keyword in label for keyword in ["company", "Company name"]):
+                    job_details["company"] = value
+                elif "position" in label:
+                    job_details["position"] = value
+                elif "role" in label:
+                    job_details["role"] = value
+                elif any(keyword in label for keyword in ["qualifications", "qualification"]):
+                    job_details["qualifications"] = value
+                elif "salary" in label:
+                    job_details["salary"] = value
+                elif any(keyword in label for keyword in ["batch", "batch eligible"]):
+                    job_details["batch"] = value
+                elif "experience" in label:
+                    job_details["experience"] = value
+                elif "location" in label:
+                    job_details["location"] = value
+                elif any(keyword in label.lower() for keyword in ["apply link", "apply now", "application link"]):
+                    job_details["apply_link"] = value
+        
+        # Case-insensitive pattern matching for "is hiring"
+        elif re.search(r'is\s+hiring', line, re.IGNORECASE):
+            company_parts = re.split(r'is\s+hiring', line, flags=re.IGNORECASE)
+            job_details["company"] = company_parts[0].strip()
+            if len(company_parts) > 1 and company_parts[1].strip():
+                job_details["title"] = company_parts[1].strip().rstrip('!')
+        
+        # Case-insensitive pattern matching for apply links
+        elif re.search(r'apply', line, re.IGNORECASE) and re.search(r'link', line, re.IGNORECASE):
+            # Look for URL in this line or the next line
+            url_match = re.search(r'(https?://\S+)', line)
+            if url_match:
+                job_details["apply_link"] = url_match.group(1)
+            elif i+1 < len(lines) and re.search(r'(https?://\S+)', lines[i+1]):
+                job_details["apply_link"] = re.search(r'(https?://\S+)', lines[i+1]).group(1)
+        elif re.search(r'^apply\s+now', line, re.IGNORECASE):
+            url_match = re.search(r'(https?://\S+)', line)
+            if url_match:
+                job_details["apply_link"] = url_match.group(1)
+            elif i+1 < len(lines) and re.search(r'(https?://\S+)', lines[i+1]):
+                job_details["apply_link"] = re.search(r'(https?://\S+)', lines[i+1]).group(1)
+        
+        # Case-insensitive pattern matching for WhatsApp and Telegram links
+        elif re.search(r'whatsapp', line, re.IGNORECASE):
+            url_match = re.search(r'(https?://\S+)', line)
+            if url_match:
+                job_details["whatsapp_link"] = url_match.group(1)
+        elif re.search(r'telegram', line, re.IGNORECASE):
+            url_match = re.search(r'(https?://\S+)', line)
+            if url_match:
+                job_details["telegram_link"] = url_match.group(1)
+                
+        # Check for shortlinks that might be apply links
+        elif re.search(r'https?://bit\.ly/\S+', line):
+            if not job_details["apply_link"]:  # Only set if not already found
+                job_details["apply_link"] = re.search(r'(https?://bit\.ly/\S+)', line).group(1)
+    
+    # Extract any URLs that might have been missed
+    for line in lines:
+        # If we haven't found an apply link yet, look for URLs
+        if not job_details["apply_link"]:
+            url_match = re.search(r'(https?://\S+)', line)
+            if url_match:
+                job_details["apply_link"] = url_match.group(1)
+    
+    # Attempt to infer job type from text if not explicitly stated - case insensitive
+    if not job_details["role"] and re.search(r'intern', text, re.IGNORECASE):
+        job_details["role"] = "Intern"
+    
+    # Set the title if not already set
+    if not job_details["title"] and job_details["company"] and job_details["role"]:
+        job_details["title"] = f"{job_details['company']} {job_details['role']}"
+    
+    return job_details
+
+
+JOB_INDICATORS = [
+    "job", "hiring", "position", "role", "salary", "apply", "qualification",
+    "experience", "freshers", "intern", "trainee",
+    "batch eligible", "graduate", "opening"
+]
+
+
+def is_job_post(text):
+    """Check if a message appears to be a job post - case insensitive"""
+    if not text:
+        return False
+    text_lower = text.lower()
+    if any(indicator in text_lower for indicator in JOB_INDICATORS):
+        return True
+    return bool(re.search(r'Jobs\s*[\|\&]\s*Internships', text, re.IGNORECASE))
+
+
+def combine_text(message_text, ocr_text):
+    """Message caption first, then any text recognised in its image"""
+    return "\n".join(part for part in (message_text, ocr_text) if part)
+
+
+def build_job_document(message, chat, job_details, image_path=None, ocr_text=None):
+    """Create the MongoDB document stored in the telegram collection"""
+    return {
+        "title": job_details["title"] or "",
+        "company": job_details["company"] or "",
+        "position": job_details["position"] or "",
+        "role": job_details["role"] or "",
+        "qualifications": job_details["qualifications"] or "",
+        "salary": job_details["salary"] or "",
+        "batch": job_details["batch"] or "",
+        "experience": job_details["experience"] or "",
+        "location": job_details["location"] or "",
+        "apply_link": job_details["apply_link"] or "",
+        "whatsapp_link": job_details["whatsapp_link"] or "",
+        "telegram_link": job_details["telegram_link"] or "",
+        "posted_by": job_details["posted_by"] or "",
+        "raw_text": message.text if message.text else "",
+        "message_id": message.id,
+        "date": message.date,
+        "group": chat,
+        "sender": str(message.sender_id),
+        "image_path": image_path,
+        "ocr_text": ocr_text or "",
+        "source": "Telegram",
+        # Canonical taxonomy ids, computed once here so matching never re-parses text
+        **taxonomy_fields(job_details["title"], job_details["role"], job_details["position"], message.text, ocr_text),
+        "createdAt": datetime.datetime.now(datetime.timezone.utc)
+    }
+
+
+def archived_keys(collection, job_posts):
+    """(group, message_id) of the posts retention already moved to <collection>_archive"""
+    if not job_posts:
+        return set()
+    archive = collection.database[f"{collection.name}_archive"]
+    query = {
+        "group": {"$in": list({doc["group"] for doc in job_posts})},
+        "message_id": {"$in": [doc["message_id"] for doc in job_posts]},
+    }
+    return {(doc["group"], doc["message_id"]) for doc in archive.find(query, {"group": 1, "message_id": 1})}
+
+
+def job_upserts(collection, job_posts):
+    """Upserts keyed on (group, message_id), so storing a message twice is a no-op
+
+    Messages retention has archived are left out: they are often still inside
+    a scraper's window, and re-inserting them would bring back a cold job and
+    alert on it again.
+
+    Also resolves each job's canonical company id (so grouping and facets are
+    exact lookups). That can hit the companies collection, which is why it
+    happens here, in the synchronous write step, and not while parsing.
+    """
+    archived = archived_keys(collection, job_posts)
+    job_posts = [doc for doc in job_posts if (doc["group"], doc["message_id"]) not in archived]
+    # createdAt is the ordering key incremental readers (snapshot export, alert
+    # polling) seek on, so stamp it at write time rather than when the message
+    # was parsed, possibly minutes earlier in a long scrape
+    now = datetime.datetime.now(datetime.timezone.utc)
+    for doc in job_posts:
+        if "company_id" not in doc:
+            doc.update(company_fields(doc["company"]))
+        doc["createdAt"] = now
+    return [
+        UpdateOne({"group": doc["group"], "message_id": doc["message_id"]}, {"$setOnInsert": doc}, upsert=True)
+        for doc in job_posts
+    ]
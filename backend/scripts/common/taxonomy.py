@@ -0,0 +1,176 @@
+import json
+import os
+import re
+from collections import deque
+from functools import lru_cache
+
+# Skill and role taxonomy shared by the scrapers, the resume parser, the
+# matcher and the Node API (which reads taxonomy.json directly). Every alias
+# maps to a canonical integer id; ids are stable, so never renumber an entry,
+# only append new ones.
+#
+# Aliases listed under an entry's "ambiguous" are ordinary English words too
+# ("Go ahead and apply", "Express your interest"). They are only matched in
+# structured skill fields: the skills= values (e.g. TimesJobs skill tags) and
+# "Skills: ..." lines inside a text.
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy.json")
+
+SKILL = "skill"
+ROLE = "role"
+
+SKILLS_LINE_RE = re.compile(
+    r"^[^\w\n]*(?:key |technical |primary )?(?:skills?|tech stack|technologies|languages)"
+    r"(?: required)?\s*[:|\-–]\s*(.+)$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _is_word_char(ch):
+    # "+" and "#" are part of names like C++ and C#
+    return ch.isalnum() or ch in "_+#"
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: finds every alias occurrence in one pass over the text"""
+
+    def __init__(self, patterns):
+        # patterns: iterable of (lowercase pattern, payload)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for pattern, payload in patterns:
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(pattern), payload))
+
+        # Breadth-first so every failure link points at an already finished state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                # Children of the root fail back to the root
+                self._fail[nxt] = self._goto[fail].get(ch, 0) if state else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text):
+        """Yield (start, end, payload) for every pattern occurrence in text"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, payload in out[state]:
+                yield i - length + 1, i + 1, payload
+
+
+class Taxonomy:
+    def __init__(self, data):
+        self.version = data["version"]
+        self.skills = {entry["id"]: entry["name"] for entry in data["skills"]}
+        self.roles = {entry["id"]: entry["name"] for entry in data["roles"]}
+
+        patterns = []
+        self._alias_ids = {SKILL: {}, ROLE: {}}
+        for kind, entries in ((SKILL, data["skills"]), (ROLE, data["roles"])):
+            for entry in entries:
+                ambiguous = {alias.lower() for alias in entry.get("ambiguous", [])}
+                for alias in [entry["name"]] + entry["aliases"]:
+                    alias = alias.lower()
+                    if alias not in self._alias_ids[kind]:
+                        self._alias_ids[kind][alias] = entry["id"]
+                        patterns.append((alias, (kind, entry["id"], alias in ambiguous)))
+        self._matcher = AhoCorasick(patterns)
+
+    def _matches(self, text, structured=False):
+        """Leftmost-longest, whole-word alias matches as (start, kind, id)
+
+        Ambiguous aliases only count when structured is true.
+        """
+        lowered = text.lower()
+        candidates = {SKILL: [], ROLE: []}
+        for start, end, (kind, tag_id, ambiguous) in self._matcher.iter_matches(lowered):
+            if ambiguous and not structured:
+                continue
+            # "/" and "," separate lists like "HTML/CSS/JavaScript"; a leading "."
+            # means a file name ("app.js"), and "/" inside a URL means a path
+            if start > 0:
+                before = lowered[start - 1]
+                if _is_word_char(before) or before in ".-":
+                    continue
+                if before == "/" and "://" in lowered[lowered.rfind(" ", 0, start) + 1:start]:
+                    continue
+            if end < len(lowered) and (_is_word_char(lowered[end]) or lowered[end] == "-"):
+                continue
+            candidates[kind].append((start, end, tag_id))
+
+        # Prefer the longest alias at each position, then skip anything it covers,
+        # so "react native" isn't also tagged as "react". Skills and roles are
+        # resolved separately: the role "react developer" still leaves React.
+        for kind, matches in candidates.items():
+            matches.sort(key=lambda match: (match[0], -match[1]))
+            covered = -1
+            for start, end, tag_id in matches:
+                if start < covered:
+                    continue
+                covered = end
+                yield start, kind, tag_id
+
+    def tag(self, *texts, skills=()):
+        """Canonical skill and role ids found in the texts, in order of first appearance
+
+        texts are free text; skills are structured skill fields (a tag, or a
+        comma separated list) where ambiguous aliases such as "Go" also count.
+        """
+        found = {SKILL: [], ROLE: []}
+        sources = []
+        for text in texts:
+            if text:
+                sources.append((text, False))
+                sources += [(line, True) for line in SKILLS_LINE_RE.findall(text)]
+        sources += [(value, True) for value in skills if value]
+        for text, structured in sources:
+            for _, kind, tag_id in self._matches(text, structured):
+                if tag_id not in found[kind]:
+                    found[kind].append(tag_id)
+        return {"skill_ids": found[SKILL], "role_ids": found[ROLE]}
+
+    def skill_id(self, name):
+        """Id for a single skill name or alias, e.g. a skill typed into a profile"""
+        return self._alias_ids[SKILL].get(name.strip().lower())
+
+    def role_id(self, name):
+        return self._alias_ids[ROLE].get(name.strip().lower())
+
+    def skill_names(self, ids):
+        return [self.skills[i] for i in ids if i in self.skills]
+
+
+@lru_cache(maxsize=1)
+def get_taxonomy():
+    with open(TAXONOMY_PATH) as f:
+        return Taxonomy(json.load(f))
+
+
+def extract_skills(text):
+    """Canonical skill names mentioned in text, in order of first appearance"""
+    taxonomy = get_taxonomy()
+    return taxonomy.skill_names(taxonomy.tag(text)["skill_ids"])
+
+
+def taxonomy_fields(*texts, skills=()):
+    """skill_ids / role_ids to store on a job document at ingest time"""
+    return get_taxonomy().tag(*texts, skills=skills)
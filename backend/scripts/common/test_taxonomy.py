@@ -0,0 +1,39 @@
+import pytest
+
+from common.taxonomy import get_taxonomy
+
+# (text, skills expected, roles expected, skills that must not be tagged)
+CASES = [
+    ("HTML/CSS/JavaScript, React/Angular", ["HTML", "CSS", "JavaScript", "React", "Angular"], [], []),
+    ("Java/Python developer", ["Java", "Python"], ["Backend Developer"], []),
+    ("Software Engineer (C++/C#)", ["C++", "C#"], ["Software Engineer"], []),
+    ("React Developer", ["React"], ["Frontend Developer"], []),
+    ("React Native developer", ["React Native"], ["Software Engineer"], ["React"]),
+    ("Fix the bug in app.js", [], [], ["JavaScript"]),
+    ("Apply at https://careers.example.com/java/jobs", [], [], ["Java"]),
+    # English words that are also skill names only count in structured fields
+    ("Go ahead and apply now! Express your interest. Grade C required. Swift hiring process.",
+     [], [], ["Go", "Express", "C", "Swift"]),
+    ("Git your resume ready, the node of our network", [], [], ["Git", "Node.js"]),
+    ("Backend role\nSkills: Go, C, Git", ["Go", "C", "Git"], [], []),
+    ("Tech stack - Node, Express, MongoDB", ["Node.js", "Express", "MongoDB"], [], []),
+    ("Golang and Node.js developer", ["Go", "Node.js"], ["Backend Developer"], []),
+]
+
+
+@pytest.mark.parametrize("text, skills, roles, absent", CASES)
+def test_tag(text, skills, roles, absent):
+    taxonomy = get_taxonomy()
+    tags = taxonomy.tag(text)
+    found_skills = taxonomy.skill_names(tags["skill_ids"])
+    found_roles = [taxonomy.roles[i] for i in tags["role_ids"]]
+
+    assert set(skills) <= set(found_skills)
+    assert set(roles) <= set(found_roles)
+    assert not set(absent) & set(found_skills)
+
+
+def test_structured_skills():
+    taxonomy = get_taxonomy()
+    tags = taxonomy.tag("Hiring now, go apply", skills=["Go", "Express"])
+    assert taxonomy.skill_names(tags["skill_ids"]) == ["Go", "Express"]
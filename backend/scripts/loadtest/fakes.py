@@ -0,0 +1,244 @@
+import datetime
+import html
+import json
+import random
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pymongo import MongoClient
+
+# Local stand-ins for the services the scrapers talk to, so the ingestion
+# pipeline can be driven offline:
+#
+#   FakeTelegramClient  - the async Telethon calls the backfill uses
+#                         (get_messages, iter_messages, download_media),
+#                         backed by in-memory channels the harness posts to
+#   FakeTimesJobsServer - serves saved (or generated) TimesJobs result pages
+#   LocalMongod         - a throwaway mongod on a free port and temp dbpath
+
+COMPANIES = ["Infosys", "TCS", "Wipro", "Accenture", "Amazon", "Zoho", "Flipkart", "Swiggy", "Razorpay", "Deloitte"]
+ROLES = ["Software Engineer", "Frontend Developer", "Backend Developer", "Data Analyst", "SDE Intern", "QA Engineer"]
+LOCATIONS = ["Bangalore", "Hyderabad", "Pune", "Chennai", "Noida", "Remote"]
+SKILLS = ["React", "Node.js", "Python", "Java", "SQL", "AWS", "Docker", "JavaScript", "MongoDB", "Spring Boot"]
+CHATTER = ["Good morning everyone!", "Share this channel with your friends 🙏", "Results will be announced soon"]
+
+
+def synthetic_messages(count, seed=0):
+    """Job posts in the labelled format the Telegram channels use, with some non-job chatter"""
+    rng = random.Random(seed)
+    messages = []
+    for i in range(count):
+        if rng.random() < 0.1:
+            messages.append({"text": rng.choice(CHATTER), "has_photo": False})
+            continue
+        company, role = rng.choice(COMPANIES), rng.choice(ROLES)
+        batch = rng.choice(["2023", "2024", "2024/2025", "2025", "2026"])
+        text = "\n".join([
+            "Jobs | Internships | Placement | Interviews",
+            f"Company Name: {company}",
+            f"Role: {role}",
+            f"Batch: {batch}",
+            f"Experience: {rng.choice(['Freshers', '0-2 Yrs', '1-3 years'])}",
+            f"Location: {rng.choice(LOCATIONS)}",
+            f"Skills: {', '.join(rng.sample(SKILLS, 3))}",
+            f"Apply Link: https://careers.example.com/{company.lower()}/{i}",
+        ])
+        messages.append({"text": text, "has_photo": rng.random() < 0.2})
+    return messages
+
+
+def load_recording(path):
+    """Messages captured with `load_harness.py record`, one JSON object per line"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class FakeMessage:
+    def __init__(self, id, text, date, sender_id=0, photo=None):
+        self.id = id
+        self.text = text
+        self.date = date
+        self.sender_id = sender_id
+        self.photo = photo
+
+
+class FakeChannel:
+    """A channel's recent history; message ids are sequential like a real channel's"""
+
+    def __init__(self, name, history=10000):
+        self.name = name
+        self.history = history
+        self.messages = []
+        self.last_id = 0
+
+    def post(self, text, posted_at, has_photo=False):
+        self.last_id += 1
+        date = datetime.datetime.fromtimestamp(posted_at, datetime.timezone.utc)
+        photo = b"\xff\xd8\xff\xe0fake-jpeg" if has_photo else None
+        message = FakeMessage(self.last_id, text, date, photo=photo)
+        self.messages.append(message)
+        # Trim in chunks so posting stays O(1) amortised
+        if len(self.messages) > 2 * self.history:
+            del self.messages[:-self.history]
+        return message
+
+    def between(self, min_id, max_id):
+        """Messages with min_id < id < max_id (max_id 0 = no upper bound), oldest first"""
+        if not self.messages:
+            return []
+        base = self.messages[0].id
+        start = max(min_id + 1 - base, 0)
+        end = max_id - base if max_id else len(self.messages)
+        return self.messages[start:max(end, start)]
+
+
+class FakeTelegramClient:
+    def __init__(self, channels):
+        self.channels = {channel.name: channel for channel in channels}
+        self.requests = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get_entity(self, chat):
+        return self.channels[chat]
+
+    async def get_messages(self, chat, limit=1):
+        self.requests += 1
+        messages = self.channels[chat].messages
+        return messages[-limit:][::-1]
+
+    async def iter_messages(self, chat, limit=None, min_id=0, max_id=0, reverse=False, wait_time=None):
+        # min_id / max_id are exclusive, as in Telethon
+        self.requests += 1
+        selected = self.channels[chat].between(min_id, max_id)
+        if not reverse:
+            selected = selected[::-1]
+        for message in selected[:limit]:
+            yield message
+
+    async def download_media(self, message, file):
+        with open(file, "wb") as f:
+            f.write(message.photo)
+        return file
+
+
+def render_timesjobs_page(count, seed=0):
+    """A search result page with the classes website_scraper.py selects on"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        company, role = rng.choice(COMPANIES), rng.choice(ROLES)
+        skills = "".join(f'<span class="srphglt">{html.escape(s)}</span>' for s in rng.sample(SKILLS, 3))
+        items.append(
+            "<li>"
+            f'<h3 class="srp-job-heading">{html.escape(role)}</h3>'
+            f'<span class="srp-comp-name">{html.escape(company)} Ltd.</span>'
+            f'<span class="posting-time">{rng.randint(1, 9)} days ago</span>'
+            f'<span class="srp-loc">{rng.choice(LOCATIONS)}</span>'
+            f'<span class="srp-exp">{rng.randint(0, 3)} - {rng.randint(4, 8)} Yrs</span>'
+            f'<span class="srp-sal">Rs {rng.randint(3, 20)} Lakhs</span>'
+            f"{skills}"
+            f'<a class="ui-link" href="https://www.timesjobs.com/job-detail/{i}">Apply</a>'
+            "</li>"
+        )
+    return f'<html><body><ul class="ui-content search-result">{"".join(items)}</ul></body></html>'
+
+
+class FakeTimesJobsServer:
+    """Serves a fixed result page on a local port and records when it was served"""
+
+    def __init__(self, page):
+        body = page.encode("utf-8")
+        served = self.served = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                served.append(time.time())
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/mobile/jobs-search-result.html"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class LocalMongod:
+    """A disposable mongod; --replset makes it a one-node replica set so transactions work"""
+
+    def __init__(self, binary="mongod", replset=False):
+        self.binary = binary
+        self.replset = replset
+        self.port = _free_port()
+        self.uri = f"mongodb://127.0.0.1:{self.port}/?directConnection=true"
+        self._dbpath = None
+        self._proc = None
+
+    def __enter__(self):
+        if not shutil.which(self.binary):
+            raise RuntimeError(f"{self.binary} not found on PATH")
+        self._dbpath = tempfile.mkdtemp(prefix="loadtest-mongod-")
+        cmd = [self.binary, "--dbpath", self._dbpath, "--port", str(self.port), "--bind_ip", "127.0.0.1", "--quiet"]
+        if self.replset:
+            cmd += ["--replSet", "rs0"]
+        self._proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        client = MongoClient(self.uri, serverSelectionTimeoutMS=500)
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                client.admin.command("ping")
+                break
+            except Exception:
+                if time.monotonic() > deadline or self._proc.poll() is not None:
+                    self.__exit__()
+                    raise RuntimeError("mongod did not start")
+                time.sleep(0.2)
+
+        if self.replset:
+            client.admin.command("replSetInitiate", {"_id": "rs0", "members": [{"_id": 0, "host": f"127.0.0.1:{self.port}"}]})
+            while not client.admin.command("hello").get("isWritablePrimary"):
+                time.sleep(0.2)
+        client.close()
+        return self
+
+    def __exit__(self, *exc):
+        if self._proc:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+        if self._dbpath:
+            shutil.rmtree(self._dbpath, ignore_errors=True)
@@ -0,0 +1,362 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_dir = os.path.dirname(script_dir)
+sys.path.append(scripts_dir)
+
+from loadtest.fakes import (
+    FakeChannel, FakeTelegramClient, FakeTimesJobsServer, LocalMongod,
+    load_recording, render_timesjobs_page, synthetic_messages
+)
+
+# Offline load/replay harness for the ingestion pipeline.
+#
+#   run     N fake channels each post M messages/s (replayed from a recording,
+#           or synthetic) while one consumer per channel polls it and pushes
+#           new messages through the backfill's fetch_range / commit_range,
+#           i.e. the real parser, taxonomy tagging and Mongo write path.
+#           Optionally runs website_scraper.py against a local copy of a
+#           TimesJobs result page. Reports sustained throughput, post->stored
+#           latency and memory.
+#   record  Capture recent messages from real channels into a JSONL file
+#           that `run --recording` replays.
+#
+# Everything is written to a scratch database (default "loadtest") that is
+# dropped at the start of each run, on a local mongod unless --allow-remote.
+
+COLLECTION = "telegram"
+
+
+def rss_mb():
+    """Resident set size of this process in MB"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        # Not Linux: fall back to the peak, which is all getrusage offers
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+class Stats:
+    def __init__(self):
+        self.posted = 0
+        self.consumed = 0
+        # (posted_at, stored_at) per stored job
+        self.jobs = []
+        self.rss = []
+
+
+async def produce(channel, messages, rate, start, end, stats, offset):
+    """Open-loop poster: message k is due at start + k / rate.
+
+    A message is dated with its due time even when the event loop gets to it
+    late, so time spent waiting behind a busy consumer counts as latency.
+    """
+    k = 0
+    while True:
+        due = start + k / rate
+        if due >= end:
+            return
+        delay = due - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        message = messages[(offset + k) % len(messages)]
+        channel.post(message["text"], due, message.get("has_photo", False))
+        stats.posted += 1
+        k += 1
+
+
+async def consume(client, chat, args, stats, stop):
+    """Poll a channel like the scrapers do and ingest everything new since the last poll"""
+    from telegram.backfill import commit_range, fetch_range
+
+    last_id = 0
+    while True:
+        latest = await client.get_messages(chat, limit=1)
+        top_id = latest[0].id if latest else 0
+        if top_id > last_id:
+            id_range = (last_id + 1, top_id)
+            job_posts, fetch_stats = await fetch_range(client, chat, id_range, 0, False)
+            await asyncio.to_thread(commit_range, chat, COLLECTION, id_range, job_posts, fetch_stats)
+            stored_at = time.time()
+            stats.consumed += fetch_stats["messages"]
+            stats.jobs.extend((doc["date"].timestamp(), stored_at) for doc in job_posts)
+            last_id = top_id
+        elif stop.is_set():
+            return
+        else:
+            await asyncio.sleep(args.poll_interval)
+
+
+async def sample_memory(stats, interval=0.5):
+    while True:
+        stats.rss.append(rss_mb())
+        await asyncio.sleep(interval)
+
+
+async def run_telegram(args, messages, stats):
+    channels = [FakeChannel(f"loadtest_{i}") for i in range(args.channels)]
+    client = FakeTelegramClient(channels)
+    stop = asyncio.Event()
+
+    monitor = asyncio.create_task(sample_memory(stats))
+    consumers = [asyncio.create_task(consume(client, channel.name, args, stats, stop)) for channel in channels]
+
+    start = time.time() + 0.5
+    end = start + args.duration
+    # Different offsets so channels don't post identical messages in lockstep
+    await asyncio.gather(*(
+        produce(channel, messages, args.rate, start, end, stats, i * 997)
+        for i, channel in enumerate(channels)
+    ))
+
+    stop.set()
+    done, pending = await asyncio.wait(consumers, timeout=args.drain)
+    for task in pending:
+        task.cancel()
+    for task in done:
+        # Surface consumer errors instead of reporting a silently short run
+        task.result()
+    monitor.cancel()
+    stats.rss.append(rss_mb())
+    return start, end
+
+
+def telegram_report(args, stats, start, end):
+    window_start = start + args.warmup
+    measured = end - window_start
+    latencies = [stored - posted for posted, stored in stats.jobs if window_start <= posted < end]
+    completed = sum(1 for _, stored in stats.jobs if window_start <= stored < end)
+    return {
+        "channels": args.channels,
+        "rate_per_channel": args.rate,
+        "offered_msgs_per_s": args.channels * args.rate,
+        "posted": stats.posted,
+        "consumed": stats.consumed,
+        "stored_jobs": len(stats.jobs),
+        "backlog": stats.posted - stats.consumed,
+        "sustained_jobs_per_s": completed / measured if measured > 0 else 0.0,
+        "latency_ms": {
+            name: (percentile(latencies, pct) or 0) * 1000
+            for name, pct in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100))
+        },
+        "rss_mb": {
+            "start": stats.rss[0] if stats.rss else None,
+            "peak": max(stats.rss) if stats.rss else None,
+            "end": stats.rss[-1] if stats.rss else None,
+        },
+    }
+
+
+def run_timesjobs(args, db):
+    """Run the real TimesJobs scraper against a locally served result page"""
+    if args.timesjobs_html:
+        with open(args.timesjobs_html, encoding="utf-8") as f:
+            page = f.read()
+    else:
+        page = render_timesjobs_page(args.timesjobs_jobs)
+
+    runs = []
+    with FakeTimesJobsServer(page) as server:
+        # MONGO_URI / MONGO_DB are already set in our environment
+        env = {**os.environ, "TIMESJOBS_URL": server.url, "TIMESJOBS_PAGE_WAIT": "0"}
+        scraper = os.path.join(scripts_dir, "websites", "website_scraper.py")
+        for _ in range(args.timesjobs_runs):
+            before = db["timesjob"].count_documents({})
+            started = time.time()
+            subprocess.run([sys.executable, scraper], env=env, stdout=subprocess.DEVNULL, check=True)
+            finished = time.time()
+            served = server.served[-1] if server.served else started
+            runs.append({
+                "jobs": db["timesjob"].count_documents({}) - before,
+                "run_s": finished - started,
+                "page_to_stored_s": finished - served,
+            })
+
+    jobs = sum(run["jobs"] for run in runs)
+    elapsed = sum(run["run_s"] for run in runs)
+    return {
+        "runs": runs,
+        "jobs_per_s": jobs / elapsed if elapsed else 0.0,
+        # Includes Chrome only when the driver was reaped as our descendant
+        "scraper_peak_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def print_report(report):
+    tg = report.get("telegram")
+    if tg:
+        lat = tg["latency_ms"]
+        print(f"\n📊 Telegram: {tg['channels']} channels × {tg['rate_per_channel']} msg/s "
+              f"= {tg['offered_msgs_per_s']} msg/s offered")
+        print(f"   posted {tg['posted']}, consumed {tg['consumed']}, stored {tg['stored_jobs']} jobs, "
+              f"backlog {tg['backlog']}")
+        print(f"   sustained throughput: {tg['sustained_jobs_per_s']:.1f} jobs/s")
+        print(f"   post→stored latency: p50 {lat['p50']:.1f}ms  p95 {lat['p95']:.1f}ms  "
+              f"p99 {lat['p99']:.1f}ms  max {lat['max']:.1f}ms")
+        rss = tg["rss_mb"]
+        print(f"   memory (RSS): start {rss['start']:.1f}MB  peak {rss['peak']:.1f}MB  end {rss['end']:.1f}MB")
+    tj = report.get("timesjobs")
+    if tj:
+        print(f"\n📊 TimesJobs: {len(tj['runs'])} scraper runs, {tj['jobs_per_s']:.1f} jobs/s, "
+              f"scraper peak RSS {tj['scraper_peak_rss_mb']:.1f}MB")
+        for i, run in enumerate(tj["runs"], 1):
+            print(f"   run {i}: {run['jobs']} jobs in {run['run_s']:.2f}s "
+                  f"(page served → stored {run['page_to_stored_s']:.2f}s)")
+
+
+def compare_to_baseline(report, path, tolerance):
+    """Regressions against a previous --report beyond the tolerated fraction"""
+    with open(path) as f:
+        baseline = json.load(f)
+    problems = []
+    old, new = baseline.get("telegram"), report.get("telegram")
+    if old and new:
+        if new["sustained_jobs_per_s"] < old["sustained_jobs_per_s"] * (1 - tolerance):
+            problems.append(f"throughput {new['sustained_jobs_per_s']:.1f} < baseline {old['sustained_jobs_per_s']:.1f} jobs/s")
+        if new["latency_ms"]["p95"] > old["latency_ms"]["p95"] * (1 + tolerance):
+            problems.append(f"p95 latency {new['latency_ms']['p95']:.1f} > baseline {old['latency_ms']['p95']:.1f}ms")
+        if new["rss_mb"]["peak"] > old["rss_mb"]["peak"] * (1 + tolerance):
+            problems.append(f"peak RSS {new['rss_mb']['peak']:.1f} > baseline {old['rss_mb']['peak']:.1f}MB")
+    return problems
+
+
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+def is_local(uri):
+    """True only when every host in the URI is this machine"""
+    from pymongo.uri_parser import parse_uri
+
+    # SRV records resolve to cluster hosts (Atlas), never to this machine
+    if uri.startswith("mongodb+srv://"):
+        return False
+    try:
+        nodes = parse_uri(uri)["nodelist"]
+    except Exception:
+        return False
+    return bool(nodes) and all(host.lower() in LOCAL_HOSTS for host, _ in nodes)
+
+
+def run(args):
+    if args.db == "test":
+        print("❌ Refusing to use the production database name 'test'")
+        sys.exit(1)
+
+    messages = load_recording(args.recording) if args.recording else synthetic_messages(args.synthetic)
+    if not messages:
+        print("❌ No messages to replay")
+        sys.exit(1)
+
+    mongod = LocalMongod(args.mongod, args.replset) if args.spawn_mongod else contextlib.nullcontext()
+    with mongod:
+        uri = mongod.uri if args.spawn_mongod else args.mongo_uri
+        if not is_local(uri) and not args.allow_remote:
+            print(f"❌ {uri} is not local; pass --allow-remote to load-test it")
+            sys.exit(1)
+
+        # common.db reads these at import time, and the scraper subprocess inherits them
+        os.environ["MONGO_URI"] = uri
+        os.environ["MONGO_DB"] = args.db
+        from common.db import get_db
+        from telegram.backfill import ensure_backfill_indexes
+
+        db = get_db()
+        db.client.drop_database(args.db)
+        ensure_backfill_indexes(db, COLLECTION)
+        print(f"✅ Using {args.db} on {uri}, replaying {len(messages)} messages")
+
+        report = {}
+        if args.channels and args.rate:
+            stats = Stats()
+            start, end = asyncio.run(run_telegram(args, messages, stats))
+            report["telegram"] = telegram_report(args, stats, start, end)
+        if args.timesjobs_runs:
+            report["timesjobs"] = run_timesjobs(args, db)
+
+    print_report(report)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Report written to {args.report}")
+    if args.baseline:
+        problems = compare_to_baseline(report, args.baseline, args.tolerance)
+        for problem in problems:
+            print(f"❌ Regression: {problem}")
+        if problems:
+            sys.exit(1)
+        print(f"✅ Within {args.tolerance:.0%} of baseline {args.baseline}")
+
+
+async def record(args):
+    from telethon import TelegramClient
+
+    from telegram.backfill import load_credentials
+
+    api_id, api_hash = load_credentials()
+    count = 0
+    async with TelegramClient(args.session, api_id, api_hash) as client:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for chat in args.chats:
+                async for message in client.iter_messages(chat, limit=args.limit, reverse=False):
+                    if not message.text and not message.photo:
+                        continue
+                    f.write(json.dumps({"chat": chat, "text": message.text or "", "has_photo": bool(message.photo)}) + "\n")
+                    count += 1
+    print(f"✅ Recorded {count} messages to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline load and replay harness for job ingestion")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Drive load through local stand-ins and report")
+    run_parser.add_argument("--channels", type=int, default=4, help="Fake Telegram channels (N)")
+    run_parser.add_argument("--rate", type=float, default=5.0, help="Messages per second per channel (M)")
+    run_parser.add_argument("--duration", type=float, default=30.0, help="Seconds of posting")
+    run_parser.add_argument("--warmup", type=float, default=5.0, help="Seconds excluded from the measurements")
+    run_parser.add_argument("--drain", type=float, default=30.0, help="Seconds to let consumers catch up afterwards")
+    run_parser.add_argument("--poll-interval", type=float, default=0.05, help="Consumer poll interval when idle")
+    run_parser.add_argument("--recording", help="JSONL from `record`; synthetic messages if omitted")
+    run_parser.add_argument("--synthetic", type=int, default=1000, help="Synthetic messages to cycle through")
+    run_parser.add_argument("--timesjobs-runs", type=int, default=0, help="Also run website_scraper.py this many times")
+    run_parser.add_argument("--timesjobs-html", help="Saved TimesJobs result page; generated if omitted")
+    run_parser.add_argument("--timesjobs-jobs", type=int, default=50, help="Jobs on the generated page")
+    run_parser.add_argument("--mongo-uri", default=os.environ.get("MONGO_URI", "mongodb://localhost:27017/"))
+    run_parser.add_argument("--spawn-mongod", action="store_true", help="Start a throwaway mongod instead")
+    run_parser.add_argument("--mongod", default="mongod", help="mongod binary for --spawn-mongod")
+    run_parser.add_argument("--replset", action="store_true", help="Make the spawned mongod a replica set (transactions)")
+    run_parser.add_argument("--allow-remote", action="store_true")
+    run_parser.add_argument("--db", default="loadtest", help="Scratch database, dropped at start")
+    run_parser.add_argument("--report", help="Write the report as JSON")
+    run_parser.add_argument("--baseline", help="Fail if worse than this earlier --report")
+    run_parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression vs the baseline")
+
+    record_parser = sub.add_parser("record", help="Capture real channel messages for replay")
+    record_parser.add_argument("chats", nargs="+")
+    record_parser.add_argument("--limit", type=int, default=500, help="Most recent messages per chat")
+    record_parser.add_argument("--output", default=os.path.join(script_dir, "recording.jsonl"))
+    record_parser.add_argument("--session", default="test")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        asyncio.run(record(args))
@@ -0,0 +1,49 @@
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(script_dir)
+
+from ocr_pipeline import OcrPipeline, images_dir
+
+
+def run(paths, workers, cache_path, label):
+    with OcrPipeline(workers, cache_path) as pipeline:
+        # Spin the pool up before timing so process start-up isn't counted
+        list(pipeline._pool.map(int, range(workers)))
+
+        start = time.perf_counter()
+        pipeline.ocr_paths(paths)
+        elapsed = time.perf_counter() - start
+
+    rate = len(paths) / elapsed if elapsed else float("inf")
+    print(f"{label:<28} workers={workers:<3} {len(paths)} images in {elapsed:7.3f}s  "
+          f"({rate:8.1f} images/s, {pipeline.stats['misses']} OCR'd)")
+    return rate
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCR throughput benchmark on the checked-in images")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(images_dir, "*.jpg")))
+    if not paths:
+        print(f"❌ No images found in {images_dir}")
+        sys.exit(1)
+
+    print(f"📊 OCR benchmark: {len(paths)} images from {images_dir}\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in args.workers:
+            # Fresh cache per run: every distinct image is a miss
+            run(paths, workers, os.path.join(tmp, f"cold-{workers}.sqlite"), "cold cache")
+
+        # Re-run against the last populated cache: every image is a hit
+        warm_cache = os.path.join(tmp, f"cold-{args.workers[-1]}.sqlite")
+        run(paths, args.workers[-1], warm_cache, "warm cache")
@@ -0,0 +1,218 @@
+import argparse
+import glob
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytesseract
+from PIL import Image, ImageOps
+from pymongo import UpdateOne
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(script_dir))
+
+from common.company_resolver import company_fields
+from common.job_parser import combine_text, parse_job_details
+from common.taxonomy import taxonomy_fields
+
+images_dir = os.path.join(os.path.dirname(script_dir), "telegram", "images")
+default_cache_path = os.path.join(script_dir, "ocr_cache.sqlite")
+
+# Tesseract page segmentation 6 ("a single uniform block of text") works best
+# for the poster-style job images the channels share
+TESSERACT_CONFIG = "--oem 1 --psm 6"
+
+BATCH_SIZE = 200
+
+
+def image_hash(path):
+    """SHA-256 of the image bytes, so renamed or re-downloaded copies share one cache entry"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _init_worker():
+    # Each worker already owns a core; stop Tesseract's OpenMP threads from
+    # oversubscribing the machine
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _ocr_image(path):
+    """Text in an image, or None when it can't be read (truncated download, not an image)"""
+    try:
+        with Image.open(path) as img:
+            img = ImageOps.grayscale(img)
+            # Telegram thumbnails are small and Tesseract misreads small glyphs, so upscale first
+            if img.width < 1000:
+                scale = 1000 / img.width
+                img = img.resize((1000, int(img.height * scale)), Image.LANCZOS)
+            return pytesseract.image_to_string(img, lang="eng", config=TESSERACT_CONFIG).strip()
+    except Exception:
+        # One bad file must not fail the whole batch
+        return None
+
+
+class OcrCache:
+    """Content-hash keyed OCR results stored in a local SQLite file"""
+
+    def __init__(self, path=default_cache_path):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("CREATE TABLE IF NOT EXISTS ocr (hash TEXT PRIMARY KEY, text TEXT NOT NULL)")
+        self._conn.commit()
+
+    def get_many(self, hashes):
+        if not hashes:
+            return {}
+        hashes = list(hashes)
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(hashes), 500):
+                chunk = hashes[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT hash, text FROM ocr WHERE hash IN ({placeholders})", chunk)
+                found.update(rows)
+        return found
+
+    def put_many(self, items):
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO ocr (hash, text) VALUES (?, ?)", items)
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+class OcrPipeline:
+    """Runs Tesseract over images in a process pool, skipping anything already cached"""
+
+    def __init__(self, workers=None, cache_path=default_cache_path):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = OcrCache(cache_path)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        self.stats = {"hits": 0, "misses": 0, "errors": 0}
+
+    def ocr_paths(self, paths):
+        """Return {path: text} for the given images; text is None for images that couldn't be read"""
+        hashes = {}
+        failed = {}
+        for path in paths:
+            try:
+                hashes[path] = image_hash(path)
+            except OSError:
+                failed[path] = None
+        self.stats["errors"] += len(failed)
+        cached = self.cache.get_many(set(hashes.values()))
+
+        # Identical images in one batch are only OCR'd once
+        todo = {}
+        for path, digest in hashes.items():
+            if digest not in cached and digest not in todo:
+                todo[digest] = path
+
+        self.stats["hits"] += len(hashes) - len(todo)
+        self.stats["misses"] += len(todo)
+
+        if todo:
+            digests = list(todo)
+            texts = self._pool.map(_ocr_image, [todo[d] for d in digests], chunksize=4)
+            fresh = list(zip(digests, texts))
+            # Failures aren't cached, so a re-downloaded image gets another try
+            self.cache.put_many([(digest, text) for digest, text in fresh if text is not None])
+            self.stats["errors"] += sum(1 for _, text in fresh if text is None)
+            cached.update(fresh)
+
+        return {**{path: cached[digest] for path, digest in hashes.items()}, **failed}
+
+    def ocr_path(self, path):
+        return self.ocr_paths([path])[path]
+
+    def close(self):
+        self._pool.shutdown()
+        self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def enrich_stored_jobs(collection, pipeline, batch_size=BATCH_SIZE):
+    """OCR the images of stored Telegram jobs and fill in fields the caption lacked"""
+    fields = list(parse_job_details(""))
+    projection = {key: 1 for key in fields + ["image_path", "raw_text", "text"]}
+    query = {"image_path": {"$ne": None}, "ocr_text": {"$in": [None, ""]}}
+
+    updated = 0
+    last_id = None
+    while True:
+        # Keyset batches on _id: bounded memory, and updated docs can't be revisited
+        batch_query = {**query, "_id": {"$gt": last_id}} if last_id else query
+        docs = list(collection.find(batch_query, projection).sort("_id", 1).limit(batch_size))
+        if not docs:
+            return updated
+        last_id = docs[-1]["_id"]
+
+        docs = [doc for doc in docs if os.path.exists(doc["image_path"])]
+        texts = pipeline.ocr_paths([doc["image_path"] for doc in docs])
+
+        ops = []
+        for doc in docs:
+            ocr_text = texts[doc["image_path"]]
+            if ocr_text is None:
+                continue
+            caption = doc.get("raw_text") or doc.get("text") or ""
+            job_details = parse_job_details(combine_text(caption, ocr_text))
+
+            update = {"ocr_text": ocr_text}
+            for key, value in job_details.items():
+                if value and not doc.get(key):
+                    update[key] = value
+            # Re-derive the ids from the filled-in fields, the same way
+            # build_job_document does, so the percolator and facets see them
+            job = {**doc, **update}
+            update.update(taxonomy_fields(job.get("title"), job.get("role"), job.get("position"), caption, ocr_text))
+            update.update(company_fields(job.get("company")))
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": update}))
+        if ops:
+            collection.bulk_write(ops, ordered=False)
+            updated += len(ops)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCR job-post images and extract job fields")
+    parser.add_argument("images", nargs="*", help=f"Image files (default: {images_dir}/*.jpg)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache", default=default_cache_path)
+    parser.add_argument("--update-db", action="store_true",
+                        help="Write OCR text and extracted fields back to the telegram collection")
+    args = parser.parse_args()
+
+    with OcrPipeline(args.workers, args.cache) as pipeline:
+        if args.update_db:
+            from common.db import get_db
+
+            count = enrich_stored_jobs(get_db()["telegram"], pipeline)
+            print(f"✅ Updated {count} Telegram jobs with OCR text")
+        else:
+            paths = args.images or sorted(glob.glob(os.path.join(images_dir, "*.jpg")))
+            for path, text in pipeline.ocr_paths(paths).items():
+                job_details = parse_job_details(text)
+                print("\n" + "=" * 60)
+                print(os.path.basename(path))
+                for key, value in job_details.items():
+                    if value:
+                        print(f"{key}: {value}")
+                print("=" * 60)
+
+        print(f"📊 OCR cache hits: {pipeline.stats['hits']}, misses: {pipeline.stats['misses']}, "
+              f"unreadable images: {pipeline.stats['errors']}")
@@ -0,0 +1,163 @@
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(script_dir))
+
+from common.taxonomy import extract_skills
+
+default_cache_path = os.path.join(script_dir, "resume_cache.sqlite")
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+# Ten-digit numbers grouped 5+5 (Indian mobiles: "+91 98765 43210") or 3+3+4,
+# with an optional "+CC"/"00CC"/"0" prefix. Whole digit groups only, so runs of
+# years ("2021 2022 2023") don't qualify.
+PHONE_RE = re.compile(
+    r"(?<![\d+])(?:(?:\+|00)\d{1,3}[\s.-]?|0)?"
+    r"(?:\d{5}[\s.-]?\d{5}|\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})(?!\d)"
+)
+URL_RE = re.compile(r"https?://[^\s\"')\]>]+|(?:www\.)?(?:linkedin\.com|github\.com|leetcode\.com)/[^\s\"')\]>]+")
+YEARS_RE = re.compile(r"(\d{1,2})\+?\s*(?:years?|yrs?)", re.IGNORECASE)
+
+# Same link rules the Gemini prompt in cvHandler.js uses
+LINK_RULES = [
+    ("linkedin", ["linkedin.com"]),
+    ("github", ["github.com"]),
+    ("leetcode", ["leetcode.com"]),
+    ("portfolio", ["vercel.app", "netlify.app"]),
+]
+
+
+def pdf_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def extract_text_and_links(data):
+    """Plain text plus every hyperlink, including link annotations that aren't in the text layer"""
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(data))
+    pages = []
+    links = []
+    for page in reader.pages:
+        pages.append(page.extract_text() or "")
+        for annot in page.get("/Annots") or []:
+            action = annot.get_object().get("/A")
+            if action and action.get("/URI"):
+                links.append(str(action["/URI"]))
+
+    text = "\n".join(pages)
+    for url in URL_RE.findall(text):
+        links.append(url if url.startswith("http") else f"https://{url}")
+    # De-duplicate, keep first-seen order
+    return text, list(dict.fromkeys(link.rstrip(".,;") for link in links))
+
+
+def classify_links(links):
+    contact = {name: "" for name, _ in LINK_RULES}
+    for url in links:
+        lowered = url.lower()
+        for name, domains in LINK_RULES:
+            if not contact[name] and any(domain in lowered for domain in domains):
+                contact[name] = url
+    return contact
+
+
+def find_phone(text):
+    """First phone number in text, or "" """
+    match = PHONE_RE.search(text)
+    return match.group(0).strip() if match else ""
+
+
+def guess_name(lines):
+    # The name is normally the first short line with no digits, @ or URL
+    for line in lines[:5]:
+        words = line.split()
+        if 1 < len(words) <= 4 and not re.search(r"[\d@/:|]", line):
+            return words[0].title(), " ".join(words[1:]).title()
+    return "", ""
+
+
+def parse_resume(data):
+    """Deterministic fields of a PDF resume, in the same shape cvHandler.js returns"""
+    text, links = extract_text_and_links(data)
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+
+    firstname, lastname = guess_name(lines)
+    email = EMAIL_RE.search(text)
+    years = [int(y) for y in YEARS_RE.findall(text) if int(y) < 50]
+    contact = classify_links(links)
+
+    return {
+        "firstname": firstname,
+        "lastname": lastname,
+        "about": "",
+        "title": "",
+        "yearOfExperience": max(years) if years else 0,
+        "education": [],
+        "experience": [],
+        "skills": extract_skills(text),
+        "socialLinks": [
+            {"name": name.capitalize(), "url": contact[name]} for name, _ in LINK_RULES
+        ],
+        "contact": {
+            "email": email.group(0) if email else "",
+            "phone": find_phone(text),
+            **contact,
+        },
+        "extractedUrls": links,
+    }
+
+
+class ResumeCache:
+    """Parse results keyed by PDF content hash, evicting the least recently used entries"""
+
+    def __init__(self, path=default_cache_path, max_entries=1000):
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS resumes ("
+            " hash TEXT PRIMARY KEY, data TEXT NOT NULL, enriched INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS resumes_last_used ON resumes (last_used)")
+        self._conn.commit()
+
+    def get(self, digest):
+        with self._lock:
+            row = self._conn.execute("SELECT data, enriched FROM resumes WHERE hash = ?", (digest,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE resumes SET last_used = ? WHERE hash = ?", (time.time(), digest))
+            self._conn.commit()
+        return {"data": json.loads(row[0]), "enriched": bool(row[1])}
+
+    def put(self, digest, data, enriched=False):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resumes (hash, data, enriched, last_used) VALUES (?, ?, ?, ?)",
+                (digest, json.dumps(data), int(enriched), time.time())
+            )
+            self._conn.execute(
+                "DELETE FROM resumes WHERE hash IN ("
+                " SELECT hash FROM resumes ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python resume_parser.py <resume.pdf>")
+        sys.exit(1)
+
+    with open(sys.argv[1], "rb") as f:
+        print(json.dumps(parse_resume(f.read()), indent=2))
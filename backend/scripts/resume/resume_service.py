@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(script_dir)
+
+from resume_parser import ResumeCache, default_cache_path, parse_resume, pdf_hash
+
+# Local resume parsing service used by resumeParseController.js
+#
+#   POST /parse          body: PDF bytes -> {success, hash, cached, enriched, data}
+#   PUT  /parse/<hash>   body: JSON      -> store an LLM-enriched result for that PDF
+#
+# The deterministic fields are parsed here without an LLM. The Node side only
+# calls Gemini when the response says the cached result isn't enriched yet, and
+# then PUTs the enriched result back so repeat uploads are answered from cache.
+
+MAX_BODY = 10 * 1024 * 1024
+HASH_PATH = re.compile(r"^/parse/([0-9a-f]{64})$")
+
+
+class ResumeHandler(BaseHTTPRequestHandler):
+    cache = None
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0 or length > MAX_BODY:
+            return None
+        return self.rfile.read(length)
+
+    def do_POST(self):
+        if self.path != "/parse":
+            return self._send(404, {"success": False, "message": "Not found"})
+
+        data = self._read_body()
+        if not data or not data.startswith(b"%PDF"):
+            return self._send(400, {"success": False, "message": "Expected a PDF body"})
+
+        start = time.perf_counter()
+        digest = pdf_hash(data)
+        hit = self.cache.get(digest)
+        if hit:
+            result, cached = hit, True
+        else:
+            try:
+                result = {"data": parse_resume(data), "enriched": False}
+            except Exception as e:
+                return self._send(422, {"success": False, "message": f"Could not read PDF: {str(e)}"})
+            self.cache.put(digest, result["data"])
+            cached = False
+
+        self._send(200, {
+            "success": True,
+            "hash": digest,
+            "cached": cached,
+            "enriched": result["enriched"],
+            "data": result["data"],
+            "elapsedMs": round((time.perf_counter() - start) * 1000, 2),
+        })
+
+    def do_PUT(self):
+        match = HASH_PATH.match(self.path)
+        if not match:
+            return self._send(404, {"success": False, "message": "Not found"})
+
+        body = self._read_body()
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return self._send(400, {"success": False, "message": "Expected a JSON object"})
+
+        self.cache.put(match.group(1), data, enriched=True)
+        self._send(200, {"success": True})
+
+    def log_message(self, format, *args):
+        print(f"📄 {self.address_string()} {format % args}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local resume parsing service with a content-hash cache")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("RESUME_PARSER_PORT", 5001)))
+    parser.add_argument("--cache", default=default_cache_path)
+    parser.add_argument("--max-entries", type=int, default=1000, help="Cached resumes kept (LRU eviction)")
+    args = parser.parse_args()
+
+    ResumeHandler.cache = ResumeCache(args.cache, args.max_entries)
+    server = ThreadingHTTPServer((args.host, args.port), ResumeHandler)
+    print(f"✅ Resume parser listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
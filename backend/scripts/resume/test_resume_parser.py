@@ -0,0 +1,19 @@
+import pytest
+
+from resume_parser import find_phone
+
+PHONE_CASES = [
+    ("Phone: +91 98765 43210", "+91 98765 43210"),
+    ("Mobile 98765 43210 | Pune", "98765 43210"),
+    ("+91-9876543210", "+91-9876543210"),
+    ("09876543210", "09876543210"),
+    ("Call +1 (555) 123-4567", "+1 (555) 123-4567"),
+    ("B.Tech 2021 2022 2023", ""),
+    ("2019 - 2023 | CGPA 8.5", ""),
+    ("Roll no. 123456789012", ""),
+]
+
+
+@pytest.mark.parametrize("text, phone", PHONE_CASES)
+def test_find_phone(text, phone):
+    assert find_phone(text) == phone
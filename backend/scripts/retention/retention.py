@@ -0,0 +1,279 @@
+import argparse
+import datetime
+import glob
+import os
+import re
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(script_dir))
+
+from common.db import get_db
+from common.indexes import JOB_COLLECTIONS
+
+images_dir = os.path.join(os.path.dirname(script_dir), "telegram", "images")
+default_archive_root = os.path.join(os.path.dirname(script_dir), "snapshot", "archive")
+
+# Retention for the hot job collections. Jobs are scored for staleness and the
+# cold ones leave the collections the jobs API reads, either into a
+# <collection>_archive collection (expired by a TTL index) or into the Arrow
+# snapshot format. Either way the archive collection keeps the job's
+# (group, message_id), so the scrapers don't re-insert it while the message is
+# still in their window. Nothing is changed unless --apply is given.
+
+YEAR_RE = re.compile(r"\b20\d\d\b")
+# The parser falls back to the first URL in a post, which is often the channel's
+# own Telegram/WhatsApp link; those are shared by unrelated jobs
+CHAT_LINK_RE = re.compile(r"^https?://(www\.)?(t\.me|telegram\.(me|dog)|wa\.me|chat\.whatsapp\.com|whatsapp\.com)/", re.IGNORECASE)
+DEAD_STATUSES = {404, 410}
+BATCH_SIZE = 1000
+
+FIELDS = {"date": 1, "createdAt": 1, "batch": 1, "apply_link": 1, "link_status": 1, "link_checked_at": 1}
+
+
+def _utc(value):
+    if isinstance(value, datetime.datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def ensure_retention_indexes(db, archive_ttl_days):
+    for name in JOB_COLLECTIONS:
+        # Partial indexes only cover jobs that have an apply link, which is the
+        # only set the duplicate and dead-link passes look at
+        has_link = {"apply_link": {"$type": "string", "$gt": ""}}
+        db[name].create_index(
+            [("apply_link", ASCENDING), ("createdAt", DESCENDING)],
+            partialFilterExpression=has_link,
+            name="apply_link_createdAt_partial"
+        )
+        db[name].create_index(
+            [("link_checked_at", ASCENDING)],
+            partialFilterExpression=has_link,
+            name="link_checked_at_partial"
+        )
+        # job_upserts looks up (group, message_id) here before re-inserting a message
+        db[f"{name}_archive"].create_index(
+            [("group", ASCENDING), ("message_id", ASCENDING)],
+            partialFilterExpression={"message_id": {"$exists": True}},
+            name="group_message_id"
+        )
+        db[f"{name}_archive"].create_index(
+            [("archivedAt", ASCENDING)],
+            expireAfterSeconds=archive_ttl_days * 24 * 60 * 60,
+            name="archivedAt_ttl"
+        )
+
+
+def staleness_reasons(doc, now, args):
+    """Why a job is cold; an empty list means it stays in the hot set"""
+    reasons = []
+    posted = _utc(doc.get("date") or doc.get("createdAt"))
+    if posted and (now - posted).days > args.max_age_days:
+        reasons.append("age")
+
+    # Batch "2021/2022" is stale once the newest eligible year is well past
+    years = [int(y) for y in YEAR_RE.findall(doc.get("batch") or "")]
+    if years and max(years) < now.year - args.batch_grace_years:
+        reasons.append("batch")
+
+    if doc.get("link_status") in DEAD_STATUSES:
+        reasons.append("dead_link")
+    return reasons
+
+
+def check_link(url, timeout):
+    """HTTP status of an apply link, or None when it couldn't be determined"""
+    headers = {"User-Agent": "Mozilla/5.0 (TalentAlign link checker)"}
+    for method in ("HEAD", "GET"):
+        try:
+            request = urllib.request.Request(url, method=method, headers=headers)
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            # Plenty of sites reject HEAD; retry those with GET
+            if method == "HEAD" and e.code in (403, 405, 501):
+                continue
+            return e.code
+        except Exception:
+            return None
+    return None
+
+
+def check_links(collection, args, now):
+    """Refresh link_status for links not checked within --recheck-days"""
+    due = now - datetime.timedelta(days=args.recheck_days)
+    cursor = collection.find(
+        {
+            "apply_link": {"$type": "string", "$gt": ""},
+            "$or": [{"link_checked_at": {"$exists": False}}, {"link_checked_at": {"$lt": due}}],
+        },
+        {"apply_link": 1}
+    ).limit(args.max_link_checks)
+    docs = [doc for doc in cursor if doc["apply_link"].startswith("http")]
+
+    # One request per distinct URL; reposts share the same link
+    urls = sorted({doc["apply_link"] for doc in docs})
+    with ThreadPoolExecutor(max_workers=args.link_workers) as pool:
+        statuses = dict(zip(urls, pool.map(lambda url: check_link(url, args.link_timeout), urls)))
+
+    ops = [
+        UpdateOne({"_id": doc["_id"]}, {"$set": {"link_status": statuses[doc["apply_link"]], "link_checked_at": now}})
+        for doc in docs
+    ]
+    if ops and args.apply:
+        collection.bulk_write(ops, ordered=False)
+    dead = sum(1 for status in statuses.values() if status in DEAD_STATUSES)
+    print(f"🔗 {collection.name}: checked {len(urls)} links, {dead} dead")
+    return statuses
+
+
+def find_duplicates(collection):
+    """Ids of older copies of a job (same company, title and apply link); the newest copy is kept"""
+    pipeline = [
+        {"$match": {"apply_link": {"$type": "string", "$gt": "", "$not": CHAT_LINK_RE}}},
+        {"$sort": {"createdAt": -1}},
+        {"$group": {
+            "_id": {"link": "$apply_link", "company": "$company_id", "title": {"$toLower": "$title"}},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+        {"$project": {"older": {"$slice": ["$ids", 1, {"$subtract": ["$count", 1]}]}}},
+    ]
+    duplicates = set()
+    for group in collection.aggregate(pipeline, allowDiskUse=True):
+        duplicates.update(group["older"])
+    return duplicates
+
+
+def move_cold(db, name, cold, args, now):
+    """Archive and remove cold jobs in batches; returns how many were moved"""
+    moved = 0
+    ids = list(cold)
+    if args.target == "snapshot":
+        from snapshot.jobs_snapshot import append_documents, open_snapshot
+
+        # Jobs a crashed run already appended but never deleted; they are only
+        # deleted this time, so a re-run doesn't write them to the snapshot twice
+        archived = set(open_snapshot(args.archive_root, [name], columns=["_id"]).column("_id").to_pylist())
+    for i in range(0, len(ids), BATCH_SIZE):
+        chunk = ids[i:i + BATCH_SIZE]
+        docs = list(db[name].find({"_id": {"$in": chunk}}))
+        if not docs:
+            continue
+        if args.target == "snapshot":
+            # Cold archive: size matters more than zero-copy reads
+            append_documents(args.archive_root, name, [doc for doc in docs if str(doc["_id"]) not in archived],
+                             compression="zstd")
+            # The archive collection keeps just the ingest key, which is what
+            # job_upserts checks to avoid re-inserting a job still being scraped
+            archive_docs = [
+                {key: doc[key] for key in ("_id", "group", "message_id") if key in doc} for doc in docs
+            ]
+        else:
+            archive_docs = docs
+        # Upserts keep a re-run after a crash from duplicating archive rows
+        db[f"{name}_archive"].bulk_write([
+            UpdateOne({"_id": doc["_id"]}, {"$setOnInsert": {
+                **doc, "archivedAt": now, "archiveReasons": cold[doc["_id"]]
+            }}, upsert=True)
+            for doc in archive_docs
+        ], ordered=False)
+        db[name].delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+        moved += len(docs)
+    return moved
+
+
+def clean_images(db, args):
+    """Delete downloaded images no hot, archived or snapshotted job points to"""
+    referenced = set()
+    for name in JOB_COLLECTIONS:
+        for coll in (name, f"{name}_archive"):
+            for doc in db[coll].find({"image_path": {"$type": "string"}}, {"image_path": 1}):
+                referenced.add(os.path.basename(doc["image_path"]))
+    if os.path.isdir(args.archive_root):
+        from snapshot.jobs_snapshot import open_snapshot
+
+        # Jobs moved with --target snapshot keep their image_path there
+        for path in open_snapshot(args.archive_root, columns=["image_path"]).column("image_path").to_pylist():
+            if path:
+                referenced.add(os.path.basename(path))
+
+    # Skip fresh files: a scraper may have downloaded one it hasn't stored yet
+    cutoff = time.time() - args.min_image_age_hours * 60 * 60
+    orphans = [
+        path for path in glob.glob(os.path.join(images_dir, "*"))
+        if os.path.basename(path) not in referenced and os.path.getmtime(path) < cutoff
+    ]
+    freed = sum(os.path.getsize(path) for path in orphans)
+    if args.apply:
+        for path in orphans:
+            os.remove(path)
+    verb = "Removed" if args.apply else "Would remove"
+    print(f"🖼 {verb} {len(orphans)} orphaned images ({freed / 1024:.0f} KB)")
+
+
+def run(db, args):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    if args.apply:
+        ensure_retention_indexes(db, args.archive_ttl_days)
+
+    for name in JOB_COLLECTIONS:
+        collection = db[name]
+        if args.check_links:
+            statuses = check_links(collection, args, now)
+        else:
+            statuses = {}
+
+        cold = {}
+        for doc in collection.find({}, FIELDS).batch_size(BATCH_SIZE):
+            # Statuses from this run apply even in dry-run mode
+            if doc.get("apply_link") in statuses:
+                doc["link_status"] = statuses[doc["apply_link"]]
+            reasons = staleness_reasons(doc, now, args)
+            if reasons:
+                cold[doc["_id"]] = reasons
+        for job_id in find_duplicates(collection):
+            cold.setdefault(job_id, []).append("duplicate")
+
+        total = collection.estimated_document_count()
+        counts = {}
+        for reasons in cold.values():
+            for reason in reasons:
+                counts[reason] = counts.get(reason, 0) + 1
+        print(f"📊 {name}: {len(cold)} of {total} jobs are cold {counts}")
+
+        if args.apply and cold:
+            moved = move_cold(db, name, cold, args, now)
+            print(f"✅ {name}: moved {moved} jobs to {args.target}")
+
+    if args.images:
+        clean_images(db, args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archive stale job postings and clean up orphaned images")
+    parser.add_argument("--apply", action="store_true", help="Actually move jobs and delete files (default: dry run)")
+    parser.add_argument("--target", choices=["archive", "snapshot"], default="archive",
+                        help="Move cold jobs to <collection>_archive or to the Arrow snapshot")
+    parser.add_argument("--archive-root", default=default_archive_root)
+    parser.add_argument("--archive-ttl-days", type=int, default=365, help="TTL of archive collection rows")
+    parser.add_argument("--max-age-days", type=int, default=60)
+    parser.add_argument("--batch-grace-years", type=int, default=1,
+                        help="Batches older than this many years before the current one are stale")
+    parser.add_argument("--check-links", action="store_true", help="HTTP-check apply links for dead pages")
+    parser.add_argument("--recheck-days", type=int, default=3)
+    parser.add_argument("--max-link-checks", type=int, default=2000)
+    parser.add_argument("--link-workers", type=int, default=16)
+    parser.add_argument("--link-timeout", type=float, default=8.0)
+    parser.add_argument("--images", action="store_true", help="Also remove orphaned files in telegram/images")
+    parser.add_argument("--min-image-age-hours", type=int, default=24)
+    run(get_db(), parser.parse_args())
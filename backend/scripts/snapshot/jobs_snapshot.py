@@ -0,0 +1,318 @@
+import argparse
+import datetime
+import json
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from bson import ObjectId, json_util
+from pymongo import UpdateOne
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(script_dir))
+
+default_root = os.path.join(script_dir, "data")
+
+# Snapshot layout (Arrow IPC files, one directory per partition):
+#
+#   <root>/_manifest.json
+#   <root>/collection=telegram/date=2025-06-13/part-00000.arrow
+#   <root>/collection=timesjob/date=2025-06-13/part-00000.arrow
+#
+# Partition files are immutable. Incremental exports only add new part files,
+# and the manifest's per-collection watermark records the last (createdAt,
+# _id) exported. Writers stamp createdAt at write time (job_upserts,
+# website_scraper.py) and exports trail now by EXPORT_LAG, so a batch still
+# being written can't end up behind the watermark. Columns keep the MongoDB field names and values (including
+# source and message_id); fields without a column go into `extra` as
+# extended JSON, so an import restores the documents as they were.
+#
+# Files are written uncompressed by default so they can be memory-mapped and
+# read with zero copies. --compression zstd/lz4 makes them smaller, but every
+# buffer is then decompressed into memory on read.
+
+COLLECTIONS = ["telegram", "timesjob"]
+MANIFEST = "_manifest.json"
+FORMAT_VERSION = 2
+BATCH_SIZE = 5000
+# Writers stamp createdAt just before their bulk write, so a job can become
+# visible slightly after its createdAt. Exports stop this far behind now, so
+# the watermark never moves past a write that hasn't landed yet.
+EXPORT_LAG = datetime.timedelta(minutes=5)
+
+SCHEMA = pa.schema([
+    ("_id", pa.string()),
+    # Partition key: the collection the document came from
+    ("collection", pa.dictionary(pa.int8(), pa.string())),
+    ("source", pa.dictionary(pa.int8(), pa.string())),
+    ("title", pa.string()),
+    ("company", pa.string()),
+    ("company_id", pa.string()),
+    ("company_name", pa.string()),
+    ("position", pa.string()),
+    ("role", pa.string()),
+    ("qualifications", pa.string()),
+    ("location", pa.string()),
+    ("experience", pa.string()),
+    ("salary", pa.string()),
+    ("batch", pa.string()),
+    ("keySkills", pa.string()),
+    ("postingTime", pa.string()),
+    ("skill_ids", pa.list_(pa.int16())),
+    ("role_ids", pa.list_(pa.int16())),
+    ("apply_link", pa.string()),
+    ("whatsapp_link", pa.string()),
+    ("telegram_link", pa.string()),
+    ("posted_by", pa.string()),
+    ("raw_text", pa.string()),
+    ("text", pa.string()),
+    ("ocr_text", pa.string()),
+    ("group", pa.dictionary(pa.int32(), pa.string())),
+    ("message_id", pa.int64()),
+    ("sender", pa.string()),
+    ("image_path", pa.string()),
+    ("link_status", pa.int16()),
+    ("link_checked_at", pa.timestamp("ms", tz="UTC")),
+    ("date", pa.timestamp("ms", tz="UTC")),
+    ("createdAt", pa.timestamp("ms", tz="UTC")),
+    # Every other field, as MongoDB extended JSON
+    ("extra", pa.string()),
+])
+
+
+def _utc(value):
+    # The TimesJobs scraper stores naive utcnow() values
+    if isinstance(value, datetime.datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def _fits(value, arrow_type):
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if pa.types.is_string(arrow_type):
+        return isinstance(value, str)
+    if pa.types.is_integer(arrow_type):
+        return isinstance(value, int) and not isinstance(value, bool)
+    if pa.types.is_timestamp(arrow_type):
+        return isinstance(value, datetime.datetime)
+    if pa.types.is_list(arrow_type):
+        return isinstance(value, list) and all(isinstance(v, int) for v in value)
+    return False
+
+
+def normalize_job(doc, collection):
+    """Map a telegram / timesjob document onto the snapshot schema without losing fields"""
+    row = {"_id": str(doc["_id"]), "collection": collection}
+    extra = {}
+    for key, value in doc.items():
+        if key == "_id":
+            continue
+        field = SCHEMA.field(key) if key in SCHEMA.names and key not in ("collection", "extra") else None
+        if value is None or field is None or not _fits(value, field.type):
+            # Unknown fields, explicit nulls and values of an unexpected type
+            # (e.g. a string message_id) survive in `extra`
+            extra[key] = value
+        else:
+            row[key] = _utc(value)
+    row["extra"] = json_util.dumps(extra) if extra else None
+    return row
+
+
+def restore_job(row):
+    """Inverse of normalize_job: the MongoDB document for a snapshot row"""
+    doc = {key: value for key, value in row.items() if value is not None and key not in ("collection", "extra")}
+    if row.get("extra"):
+        doc.update(json_util.loads(row["extra"]))
+    doc["_id"] = ObjectId(row["_id"]) if ObjectId.is_valid(row["_id"]) else row["_id"]
+    return doc
+
+
+def load_manifest(root):
+    path = os.path.join(root, MANIFEST)
+    if not os.path.exists(path):
+        return {"version": FORMAT_VERSION, "watermarks": {}, "partitions": []}
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{root} is a version {manifest.get('version')} snapshot; re-export it with --full")
+    return manifest
+
+
+def save_manifest(root, manifest):
+    path = os.path.join(root, MANIFEST)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def _write_partition(root, collection, day, rows, compression):
+    part_dir = os.path.join(root, f"collection={collection}", f"date={day}")
+    os.makedirs(part_dir, exist_ok=True)
+    part_no = len([name for name in os.listdir(part_dir) if name.endswith(".arrow")])
+    path = os.path.join(part_dir, f"part-{part_no:05d}.arrow")
+
+    table = pa.Table.from_pylist(rows, schema=SCHEMA)
+    options = ipc.IpcWriteOptions(compression=None if compression == "none" else compression)
+    # Write to a temp name and rename so readers never see a half-written file
+    with pa.OSFile(path + ".tmp", "wb") as sink:
+        with ipc.new_file(sink, SCHEMA, options=options) as writer:
+            writer.write_table(table)
+    os.replace(path + ".tmp", path)
+    return os.path.relpath(path, root)
+
+
+def export_snapshot(db, root, collections=COLLECTIONS, compression="none", full=False, lag=EXPORT_LAG):
+    """Export new documents since the last run, grouped into (collection, date) partitions"""
+    os.makedirs(root, exist_ok=True)
+    if full:
+        manifest = {"version": FORMAT_VERSION, "watermarks": {}, "partitions": []}
+    else:
+        manifest = load_manifest(root)
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - lag
+
+    for collection in collections:
+        mark = manifest["watermarks"].get(collection)
+        if mark:
+            created = datetime.datetime.fromisoformat(mark["createdAt"])
+            last_id = ObjectId(mark["_id"])
+            query = {"createdAt": {"$lte": cutoff}, "$or": [
+                {"createdAt": {"$gt": created}},
+                {"createdAt": created, "_id": {"$gt": last_id}},
+            ]}
+        else:
+            # A first export also takes documents from before createdAt existed
+            query = {"$or": [{"createdAt": {"$lte": cutoff}}, {"createdAt": {"$exists": False}}]}
+
+        cursor = db[collection].find(query).sort([("createdAt", 1), ("_id", 1)]).batch_size(BATCH_SIZE)
+
+        by_day = {}
+        exported = 0
+        last_doc = None
+        for doc in cursor:
+            row = normalize_job(doc, collection)
+            day = row["createdAt"].date().isoformat() if row.get("createdAt") else "unknown"
+            by_day.setdefault(day, []).append(row)
+            exported += 1
+            last_doc = doc
+            # Flush the largest partition buffer so memory stays bounded
+            if exported % BATCH_SIZE == 0:
+                day, rows = max(by_day.items(), key=lambda item: len(item[1]))
+                manifest["partitions"].append(_write_partition(root, collection, day, rows, compression))
+                del by_day[day]
+
+        for day, rows in by_day.items():
+            manifest["partitions"].append(_write_partition(root, collection, day, rows, compression))
+
+        if last_doc is not None:
+            manifest["watermarks"][collection] = {
+                "createdAt": _utc(last_doc["createdAt"]).isoformat(),
+                "_id": str(last_doc["_id"]),
+            }
+        # The manifest is only advanced after the partitions are on disk
+        save_manifest(root, manifest)
+        print(f"✅ Exported {exported} {collection} jobs")
+
+    return manifest
+
+
+def append_documents(root, collection, docs, compression="none"):
+    """Write arbitrary documents (e.g. archived jobs) as new partitions, leaving watermarks alone"""
+    os.makedirs(root, exist_ok=True)
+    manifest = load_manifest(root)
+    by_day = {}
+    for doc in docs:
+        row = normalize_job(doc, collection)
+        day = row["createdAt"].date().isoformat() if row.get("createdAt") else "unknown"
+        by_day.setdefault(day, []).append(row)
+    for day, rows in by_day.items():
+        manifest["partitions"].append(_write_partition(root, collection, day, rows, compression))
+    save_manifest(root, manifest)
+    return sum(len(rows) for rows in by_day.values())
+
+
+def _selected(rel_path, collections, since):
+    parts = dict(piece.split("=", 1) for piece in rel_path.split(os.sep)[:2])
+    if collections and parts["collection"] not in collections:
+        return False
+    return since is None or parts["date"] >= since
+
+
+def iter_tables(root, collections=None, since=None, columns=None):
+    """Yield one memory-mapped Arrow table per partition file"""
+    for rel_path in load_manifest(root)["partitions"]:
+        if not _selected(rel_path, collections, since):
+            continue
+        source = pa.memory_map(os.path.join(root, rel_path), "r")
+        table = ipc.open_file(source).read_all()
+        yield table.select(columns) if columns else table
+
+
+def open_snapshot(root=default_root, collections=None, since=None, columns=None):
+    """Read the snapshot (or the selected partitions) as a single Arrow table
+
+    collections: collection names to include, since: ISO date of the first partition.
+    Reads are zero-copy only for partitions written with compression "none"
+    (the default); compressed partitions are decompressed into memory.
+    """
+    tables = list(iter_tables(root, collections, since, columns))
+    if not tables:
+        schema = pa.schema([SCHEMA.field(name) for name in columns]) if columns else SCHEMA
+        return schema.empty_table()
+    return pa.concat_tables(tables)
+
+
+def import_snapshot(db, root, collections=None):
+    """Load a snapshot back into MongoDB, inserting documents that are missing"""
+    for collection in collections or COLLECTIONS:
+        imported = 0
+        for table in iter_tables(root, [collection]):
+            for batch in table.to_batches(BATCH_SIZE):
+                ops = []
+                for row in batch.to_pylist():
+                    doc = restore_job(row)
+                    if doc.get("message_id") is not None and doc.get("group"):
+                        # Telegram jobs are keyed on (group, message_id); matching on it
+                        # keeps a re-scraped copy with a different _id from being duplicated
+                        key = {"group": doc["group"], "message_id": doc["message_id"]}
+                    else:
+                        key = {"_id": doc["_id"]}
+                    # Existing documents win, so an import never overwrites newer data
+                    ops.append(UpdateOne(key, {"$setOnInsert": doc}, upsert=True))
+                if ops:
+                    result = db[collection].bulk_write(ops, ordered=False)
+                    imported += result.upserted_count
+        print(f"✅ Imported {imported} {collection} jobs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Columnar snapshot export/import of the jobs corpus")
+    parser.add_argument("command", choices=["export", "import", "info"])
+    parser.add_argument("--root", default=default_root, help="Snapshot directory")
+    parser.add_argument("--collection", action="append", choices=COLLECTIONS, help="Limit to a collection")
+    parser.add_argument("--compression", choices=["none", "zstd", "lz4"], default="none",
+                        help="none keeps reads zero-copy; zstd/lz4 trade that for smaller files")
+    parser.add_argument("--full", action="store_true", help="Ignore watermarks and export everything")
+    args = parser.parse_args()
+
+    if args.command == "info":
+        manifest = load_manifest(args.root)
+        table = open_snapshot(args.root, args.collection, columns=["_id"])
+        print(f"📊 {table.num_rows} jobs in {len(manifest['partitions'])} partitions")
+        for collection in COLLECTIONS:
+            mark = manifest["watermarks"].get(collection)
+            if mark:
+                print(f"   {collection}: exported up to {mark['createdAt']}")
+        sys.exit(0)
+
+    from common.db import get_db
+
+    if args.command == "export":
+        if args.full and os.path.exists(args.root) and os.listdir(args.root):
+            print(f"❌ --full needs an empty snapshot directory: {args.root}")
+            sys.exit(1)
+        export_snapshot(get_db(), args.root, args.collection or COLLECTIONS, args.compression, args.full)
+    else:
+        import_snapshot(get_db(), args.root, args.collection)
@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import configparser
+import datetime
+import os
+import sys
+import time
+
+from pymongo.errors import ConfigurationError, OperationFailure
+from telethon import TelegramClient
+from telethon.errors import FloodWaitError
+
+# Get absolute paths
+script_dir = os.path.dirname(os.path.abspath(__file__))
+config_path = os.path.join(script_dir, "telethon.config")
+sys.path.append(os.path.dirname(script_dir))
+
+from common.db import get_client, get_db
+from common.indexes import ensure_job_indexes
+from common.job_parser import build_job_document, combine_text, is_job_post, job_upserts, parse_job_details
+
+# Output directories
+save_dir = os.path.join(script_dir, "images")
+
+CHECKPOINTS = "backfill_checkpoints"
+
+
+def load_credentials():
+    # Check if config file exists
+    if not os.path.exists(config_path):
+        print(f"❌ Config file not found at: {config_path}")
+        sys.exit(1)
+
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config["telethon_credentials"]["api_id"], config["telethon_credentials"]["api_hash"]
+
+
+def ensure_backfill_indexes(db, collection_name):
+    ensure_job_indexes(db[collection_name])
+    db[CHECKPOINTS].create_index([("chat", 1), ("start_id", 1)])
+
+
+def load_committed_ranges(db, chat):
+    cursor = db[CHECKPOINTS].find({"chat": chat}, {"start_id": 1, "end_id": 1}).sort("start_id", 1)
+    return [(doc["start_id"], doc["end_id"]) for doc in cursor]
+
+
+def plan_ranges(committed, top_id, range_size):
+    """Split the gaps between committed ranges in [1, top_id] into fixed-size id ranges"""
+    pending = []
+    next_id = 1
+    for start_id, end_id in committed + [(top_id + 1, top_id + 1)]:
+        gap_end = min(start_id - 1, top_id)
+        while next_id <= gap_end:
+            pending.append((next_id, min(next_id + range_size - 1, gap_end)))
+            next_id += range_size
+        next_id = max(next_id, end_id + 1)
+    return pending
+
+
+def commit_range(chat, collection_name, id_range, job_posts, stats):
+    """Write a range's jobs and its checkpoint, atomically when the server supports it"""
+    db = get_db()
+    start_id, end_id = id_range
+    ops = job_upserts(db[collection_name], job_posts)
+    checkpoint = {
+        "_id": f"{chat}:{start_id}-{end_id}",
+        "chat": chat,
+        "start_id": start_id,
+        "end_id": end_id,
+        "messages": stats["messages"],
+        "jobs": len(job_posts),
+        "committedAt": datetime.datetime.now(datetime.timezone.utc)
+    }
+
+    def write(session=None):
+        if ops:
+            db[collection_name].bulk_write(ops, ordered=False, session=session)
+        db[CHECKPOINTS].replace_one({"_id": checkpoint["_id"]}, checkpoint, upsert=True, session=session)
+
+    try:
+        with get_client().start_session() as session:
+            session.with_transaction(write)
+    except (ConfigurationError, OperationFailure) as e:
+        # Standalone servers have no transactions. The job upserts are keyed on
+        # (group, message_id), so writing them before the checkpoint is still
+        # crash-safe: a range that dies in between is simply replayed.
+        if "transaction" not in str(e).lower() and "replica set" not in str(e).lower():
+            raise
+        write()
+
+
+async def fetch_range(client, chat, id_range, wait_time, download_images, ocr=None):
+    start_id, end_id = id_range
+    job_posts = []
+    stats = {"messages": 0, "skipped": 0}
+
+    # Download the whole range first, so its photos go to the OCR pool as one batch
+    fetched = []
+    # min_id / max_id are exclusive bounds
+    async for message in client.iter_messages(
+        chat, min_id=start_id - 1, max_id=end_id + 1, reverse=True, wait_time=wait_time
+    ):
+        stats["messages"] += 1
+
+        # Without OCR an image only matters for posts the caption already
+        # identifies as jobs; anything else would just be an orphan on disk
+        image_path = None
+        if download_images and message.photo and (ocr or is_job_post(message.text)):
+            image_path = os.path.join(save_dir, f"{message.id}.jpg")
+            if not os.path.exists(image_path):
+                await client.download_media(message, file=image_path)
+        fetched.append((message, image_path))
+
+    # Many channels post the details only inside the image
+    ocr_texts = {}
+    image_paths = [image_path for _, image_path in fetched if image_path]
+    if ocr and image_paths:
+        ocr_texts = await asyncio.to_thread(ocr.ocr_paths, image_paths)
+
+    for message, image_path in fetched:
+        ocr_text = ocr_texts.get(image_path)
+        text = combine_text(message.text, ocr_text)
+
+        if not is_job_post(text):
+            stats["skipped"] += 1
+            continue
+
+        job_details = parse_job_details(text)
+        job_posts.append(build_job_document(message, chat, job_details, image_path, ocr_text))
+
+    return job_posts, stats
+
+
+async def backfill_chat(client, chat, args):
+    db = get_db()
+    latest = await client.get_messages(chat, limit=1)
+    if not latest:
+        print(f"⚠ No messages in chat {chat}")
+        return
+
+    top_id = latest[0].id
+    committed = await asyncio.to_thread(load_committed_ranges, db, chat)
+    pending = plan_ranges(committed, top_id, args.range_size)
+    print(f"📊 {chat}: latest message id {top_id}, {len(committed)} ranges committed, {len(pending)} pending")
+
+    deadline = time.monotonic() + args.deadline if args.deadline else None
+    semaphore = asyncio.Semaphore(args.workers)
+    totals = {"ranges": 0, "messages": 0, "jobs": 0, "deferred": 0}
+
+    def out_of_time(extra=0):
+        return deadline is not None and time.monotonic() + extra >= deadline
+
+    async def run(id_range):
+        async with semaphore:
+            if out_of_time():
+                totals["deferred"] += 1
+                return
+
+            while True:
+                try:
+                    job_posts, stats = await fetch_range(
+                        client, chat, id_range, args.wait_time, not args.no_images, args.ocr_pipeline
+                    )
+                    break
+                except FloodWaitError as e:
+                    # Hold this worker's slot while waiting so the other workers
+                    # don't immediately trip the same limit
+                    if out_of_time(e.seconds):
+                        print(f"⏳ FloodWait of {e.seconds}s exceeds the deadline, deferring {id_range}")
+                        totals["deferred"] += 1
+                        return
+                    print(f"⏳ FloodWait: sleeping {e.seconds}s before retrying {id_range}")
+                    await asyncio.sleep(e.seconds)
+
+            await asyncio.to_thread(commit_range, chat, args.collection, id_range, job_posts, stats)
+            totals["ranges"] += 1
+            totals["messages"] += stats["messages"]
+            totals["jobs"] += len(job_posts)
+            print(f"✅ {chat} [{id_range[0]}-{id_range[1]}]: {stats['messages']} messages, "
+                  f"{len(job_posts)} jobs, {stats['skipped']} skipped")
+
+    await asyncio.gather(*(run(id_range) for id_range in pending))
+
+    print(f"📊 {chat}: committed {totals['ranges']} ranges ({totals['messages']} messages, "
+          f"{totals['jobs']} jobs), {totals['deferred']} deferred to the next run")
+
+
+async def main(args):
+    api_id, api_hash = load_credentials()
+    if not args.no_images:
+        os.makedirs(save_dir, exist_ok=True)
+
+    await asyncio.to_thread(ensure_backfill_indexes, get_db(), args.collection)
+
+    args.ocr_pipeline = None
+    if args.ocr:
+        from ocr.ocr_pipeline import OcrPipeline
+
+        args.ocr_pipeline = OcrPipeline(args.ocr_workers)
+
+    try:
+        async with TelegramClient(args.session, api_id, api_hash) as client:
+            print(f"✅ Successfully connected to Telegram client")
+            for chat in args.chats:
+                try:
+                    await backfill_chat(client, chat, args)
+                except Exception as e:
+                    print(f"❌ Error backfilling chat {chat}: {str(e)}")
+    finally:
+        if args.ocr_pipeline:
+            args.ocr_pipeline.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Checkpointed backfill of full Telegram channel history")
+    parser.add_argument("chats", nargs="+", help="Channels/groups to backfill")
+    parser.add_argument("--range-size", type=int, default=500, help="Message ids per committed range")
+    parser.add_argument("--workers", type=int, default=2, help="Ranges fetched concurrently")
+    parser.add_argument("--wait-time", type=float, default=1.0,
+                        help="Seconds between history requests within a range")
+    parser.add_argument("--deadline", type=int, default=0,
+                        help="Stop starting new ranges after this many seconds (0 = no limit)")
+    parser.add_argument("--collection", default="telegram")
+    parser.add_argument("--session", default="test")
+    parser.add_argument("--no-images", action="store_true", help="Skip downloading photos")
+    parser.add_argument("--ocr", action="store_true", help="OCR downloaded photos and parse their text too")
+    parser.add_argument("--ocr-workers", type=int, default=None)
+    asyncio.run(main(parser.parse_args()))
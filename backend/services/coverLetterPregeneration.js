@@ -0,0 +1,85 @@
+const mongoose = require("mongoose");
+const User = require("../models/User");
+const { pregenerateCoverLetters } = require("./coverLetterService");
+const { skillIdsFor } = require("../utils/taxonomy");
+
+const TOP_JOBS_PER_USER = parseInt(process.env.COVER_LETTER_PREGEN_TOP, 10) || 5;
+const CONCURRENCY = parseInt(process.env.COVER_LETTER_PREGEN_CONCURRENCY, 10) || 2;
+// Only recent postings are worth a letter, and it bounds the matching work
+const RECENT_JOBS = 1000;
+
+const escapeRegex = (value) => value.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+
+const loadRecentJobs = async () => {
+    const projection = { title: 1, company: 1, keySkills: 1, text: 1, raw_text: 1, skill_ids: 1 };
+    const [telegram, times] = await Promise.all(
+        ["telegram", "timesjob"].map((name) =>
+            mongoose.connection.db.collection(name)
+                .find({}, { projection })
+                .sort({ createdAt: -1, _id: -1 })
+                .limit(RECENT_JOBS)
+                .toArray()
+        )
+    );
+    return [...telegram, ...times].map((job) => ({
+        ...job,
+        haystack: `${job.title || ""} ${job.keySkills || ""} ${job.text || job.raw_text || ""}`.toLowerCase()
+    }));
+};
+
+// Rank jobs by how many of the user's skills they mention. Jobs tagged at
+// ingest compare canonical taxonomy ids ("ReactJS" and "React" are one skill);
+// older untagged documents fall back to a whole-word text search.
+const topJobsFor = (jobs) => async (user) => {
+    const skills = (user.skills || []).filter(Boolean);
+    const userSkillIds = new Set(skillIdsFor(skills));
+    const patterns = skills.map((skill) => new RegExp(`\\b${escapeRegex(skill.toLowerCase())}\\b`));
+    if (!patterns.length) return [];
+
+    const score = (job) => Array.isArray(job.skill_ids)
+        ? job.skill_ids.filter((id) => userSkillIds.has(id)).length
+        : patterns.filter((pattern) => pattern.test(job.haystack)).length;
+
+    return jobs
+        .map((job) => ({ job, score: score(job) }))
+        .filter(({ score }) => score > 0)
+        .sort((a, b) => b.score - a.score)
+        .slice(0, TOP_JOBS_PER_USER)
+        .map(({ job }) => job);
+};
+
+const runCoverLetterPregeneration = async () => {
+    try {
+        const [users, jobs] = await Promise.all([
+            // Most recently active first: the run is capped to a share of the
+            // cache, so these are the users who get letters when it fills
+            User.find({}, { name: 1, skills: 1, experience: 1 }).sort({ updatedAt: -1 }).lean(),
+            loadRecentJobs()
+        ]);
+        console.log(`✉️ Pre-generating cover letters for ${users.length} users...`);
+        const summary = await pregenerateCoverLetters(users, topJobsFor(jobs), CONCURRENCY);
+        console.log("✅ Cover letter pre-generation finished:", summary);
+        return summary;
+    } catch (err) {
+        console.error("❌ Cover letter pre-generation failed:", err);
+    }
+};
+
+// Runs in the API process so the letters land in the same cache the
+// /api/v1/cover-letter route reads from
+const scheduleCoverLetterPregeneration = () => {
+    const minutes = parseInt(process.env.COVER_LETTER_PREGEN_INTERVAL_MINUTES, 10);
+    if (!minutes) return;
+
+    let running = false;
+    const run = async () => {
+        if (running) return;
+        running = true;
+        await runCoverLetterPregeneration();
+        running = false;
+    };
+    run();
+    setInterval(run, minutes * 60 * 1000).unref();
+};
+
+module.exports = { runCoverLetterPregeneration, scheduleCoverLetterPregeneration };
@@ -0,0 +1,19 @@
+const axios = require("axios");
+
+// Client for the local Python resume parser (backend/scripts/resume/resume_service.py)
+const RESUME_PARSER_URL = process.env.RESUME_PARSER_URL || "http://127.0.0.1:5001";
+
+const parseLocally = async (pdfBuffer) => {
+    const response = await axios.post(`${RESUME_PARSER_URL}/parse`, pdfBuffer, {
+        headers: { "Content-Type": "application/pdf" },
+        maxBodyLength: 10 * 1024 * 1024,
+        timeout: 15000
+    });
+    return response.data;
+};
+
+const storeEnriched = async (hash, data) => {
+    await axios.put(`${RESUME_PARSER_URL}/parse/${hash}`, data, { timeout: 5000 });
+};
+
+module.exports = { parseLocally, storeEnriched };
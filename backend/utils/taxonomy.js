@@ -0,0 +1,28 @@
+const path = require("path");
+
+// Shared skill/role taxonomy. The Python ingestion layer tags every job with
+// these ids (skill_ids / role_ids), so matching here is an integer set lookup.
+const taxonomy = require(path.join(__dirname, "..", "scripts", "common", "taxonomy.json"));
+
+const buildAliasIndex = (entries) => {
+    const index = new Map();
+    for (const entry of entries) {
+        for (const alias of [entry.name, ...entry.aliases]) {
+            const key = alias.toLowerCase();
+            if (!index.has(key)) index.set(key, entry.id);
+        }
+    }
+    return index;
+};
+
+const skillAliases = buildAliasIndex(taxonomy.skills);
+const roleAliases = buildAliasIndex(taxonomy.roles);
+
+// Canonical ids for free-form skill names such as a user's profile skills
+const skillIdsFor = (skills = []) => [
+    ...new Set(skills.map((skill) => skillAliases.get(String(skill).trim().toLowerCase())).filter(Boolean))
+];
+
+const roleIdFor = (role = "") => roleAliases.get(String(role).trim().toLowerCase());
+
+module.exports = { taxonomy, skillIdsFor, roleIdFor };
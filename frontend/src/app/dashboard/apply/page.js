@@ -5,7 +5,7 @@ import { useSearchParams } from "next/navigation";
 import { useSelector } from "react-redux";
 import { toast } from "react-hot-toast";
 import { generateCoverLetter } from "@/services/coverLetterService";
-import { fetchTelegramJobs, fetchTimesJobs } from "@/services/jobService";
+import { fetchJobById } from "@/services/jobService";
 import { trackJobApplication } from "@/services/applicationService";
 
 // Import the getToken function
@@ -42,15 +42,13 @@ function ApplyPageContent() {
 
       try {
         setJobLoading(true);
-        const res = source === "times" 
-          ? await fetchTimesJobs() 
-          : await fetchTelegramJobs();
+        const res = await fetchJobById(source, jobId);
         
-        if (!res || !res.jobs) {
-          throw new Error("Invalid response from job service");
+        if (!res || !res.success) {
+          throw new Error(res?.message || "Invalid response from job service");
         }
 
-        const foundJob = res.jobs.find((j) => j._id === jobId);
+        const foundJob = res.job;
         
         if (!foundJob) {
           toast.error("Job not found");
@@ -106,6 +106,9 @@ export default function DashboardPage() {
     const [loading, setLoading] = useState(true);
     const [jobsLoading, setJobsLoading] = useState({ telegram: false, times: false });
     const [retryCount, setRetryCount] = useState(0);
+    // Cursor of the next page per source; null once everything is loaded
+    const [nextCursors, setNextCursors] = useState({ telegram: null, times: null });
+    const [loadingMore, setLoadingMore] = useState(false);
     
     const dispatch = useDispatch();
     const router = useRouter();
@@ -209,6 +212,7 @@ export default function DashboardPage() {
             if (telegramRes.status === 'fulfilled' && telegramRes.value?.success) {
                 const processedTelegramJobs = processJobs(telegramRes.value.jobs, 'telegram');
                 setTelegramJobs(processedTelegramJobs);
+                setNextCursors(prev => ({ ...prev, telegram: telegramRes.value.nextCursor }));
                 setJobsLoading(prev => ({ ...prev, telegram: false }));
                 
                 if (processedTelegramJobs.length > 0) {
@@ -229,6 +233,7 @@ export default function DashboardPage() {
             if (timesRes.status === 'fulfilled' && timesRes.value?.success) {
                 const processedTimesJobs = processJobs(timesRes.value.jobs, 'times');
                 setTimesJobs(processedTimesJobs);
+                setNextCursors(prev => ({ ...prev, times: timesRes.value.nextCursor }));
                 setJobsLoading(prev => ({ ...prev, times: false }));
                 
                 if (processedTimesJobs.length > 0) {
@@ -289,10 +294,35 @@ export default function DashboardPage() {
         fetchJobsWithRetry();
     }, [userData]);
 
+    // Fetch the next page of the active tab and merge it into the match-sorted list
+    const handleLoadMore = async () => {
+        const source = activeTab;
+        const cursor = nextCursors[source];
+        if (!cursor || loadingMore) return;
+
+        setLoadingMore(true);
+        try {
+            const res = source === "telegram" ? await fetchTelegramJobs(cursor) : await fetchTimesJobs(cursor);
+            if (!res?.success) {
+                throw new Error(res?.message || "Request failed");
+            }
+            const more = processJobs(res.jobs, source);
+            const setJobs = source === "telegram" ? setTelegramJobs : setTimesJobs;
+            setJobs(prev => [...prev, ...more].sort((a, b) => b.matchPercentage - a.matchPercentage));
+            setNextCursors(prev => ({ ...prev, [source]: res.nextCursor }));
+        } catch (error) {
+            console.error(`Error loading more ${source} jobs:`, error);
+            showToast("Failed to load more jobs. Please try again.", "error");
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleRefresh = () => {
         setRetryCount(0);
         setTelegramJobs([]);
         setTimesJobs([]);
+        setNextCursors({ telegram: null, times: null });
         fetchJobsWithRetry();
         showToast("Refreshing job listings...", "info");
     };
@@ -475,6 +505,17 @@ export default function DashboardPage() {
                             )}
                         </div>
                     )}
+                    {!loading && nextCursors[activeTab] && (
+                        <div className="text-center mt-8">
+                            <button
+                                onClick={handleLoadMore}
+                                disabled={loadingMore}
+                                className="bg-blue-600 text-white px-4 py-2 rounded-md hover:bg-blue-700 disabled:opacity-50"
+                            >
+                                {loadingMore ? "Loading..." : "Load more jobs"}
+                            </button>
+                        </div>
+                    )}
                 </main>
             </div>
         </AuthGuard>
@@ -4,12 +4,23 @@ import axios from "axios";
 // const API_URL = "http://localhost:5000/api/v1/jobs"; // Backend URL
 const API_URL = "https://talentalign-backend.onrender.com/api/v1/jobs";
 
-export const fetchTelegramJobs = async () => {
-    const response = await axios.get(`${API_URL}/telegram`);
+const PAGE_SIZE = 100;
+
+// One keyset page: { success, jobs, nextCursor }. Pass nextCursor back to get
+// the following page; null means there are no more jobs.
+const fetchPage = async (path, cursor) => {
+    const response = await axios.get(`${API_URL}/${path}`, {
+        params: { limit: PAGE_SIZE, ...(cursor && { cursor }) }
+    });
     return response.data;
 }
 
-export const fetchTimesJobs = async () => {
-    const response = await axios.get(`${API_URL}/times`);
+export const fetchTelegramJobs = async (cursor = null) => fetchPage("telegram", cursor);
+
+export const fetchTimesJobs = async (cursor = null) => fetchPage("times", cursor);
+
+export const fetchJobById = async (source, jobId) => {
+    const path = source === "times" ? "times" : "telegram";
+    const response = await axios.get(`${API_URL}/${path}/${jobId}`);
     return response.data;
-}
\ No newline at end of file
+}
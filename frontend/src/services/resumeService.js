@@ -32,19 +32,21 @@ export const parseResumeWithUrl = async (fileUrl) => {
   }
 };
 
+// Sends the PDF straight to /process-cv: the backend parses it locally and
+// caches by content hash, so there's no ImageKit upload per parse
 export const parseResume = async (file) => {
   try {
-    // First upload the file
-    const uploadResult = await uploadResume(file);
-    
-    if (!uploadResult.success || !uploadResult.fileUrl) {
-      throw new Error("Failed to upload resume");
-    }
-    
-    // Then process the CV
-    return await parseResumeWithUrl(uploadResult.fileUrl);
+    const formData = new FormData();
+    formData.append('file', file);
+
+    const response = await axios.post(`${API_URL}/process-cv`, formData, {
+      headers: {
+        'Content-Type': 'multipart/form-data'
+      }
+    });
+    return response.data;
   } catch (error) {
-    console.error("Resume processing error:", error);
+    console.error("Resume processing error:", error.response?.data || error.message);
     throw error;
   }
-};
\ No newline at end of file
+};